@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import argparse
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from app.main import PyBiteApp, DEFAULT_SCORES_PATH
+from core.quality_governor import QualityLevel, QUALITY_LADDER
+from vision.camera import Camera
+from vision.tracker_pool import TrackerPool
+
+
+class CabinetApp(PyBiteApp):
+    """
+    Several stations, each with its own camera and board, in one process.
+
+    Frames from every camera go to one shared TrackerPool, so all stations' trackers
+    share a few worker processes instead of one process each. Tracking results arrive
+    asynchronously and are extrapolated to the current frame like skipped frames
+    in the single-camera app.
+    """
+
+    def __init__(self, camera_sources: List, workers: int = None, **kwargs):
+        self.camera_sources = camera_sources
+        self.workers = workers
+        super().__init__(players=len(camera_sources), **kwargs)
+
+    def _start_vision(self, camera_source, players: int):
+        self.cameras = [Camera(source).start() for source in self.camera_sources]
+        self.pool = TrackerPool(stations=players, frame_size=QUALITY_LADDER[0].capture_size, workers=self.workers)
+        self._last_captured = [None] * players
+        self._frames_seen = [0] * players
+
+    def _stop_vision(self):
+        for camera in self.cameras:
+            camera.stop()
+        self.pool.close()
+
+    def _apply_quality(self, level: QualityLevel):
+        self.quality = level
+        self.pool.model_complexity = level.model_complexity
+        self.pool.inference_scale = level.inference_scale
+        for camera in self.cameras:
+            camera.set_capture(*level.capture_size, level.capture_fps)
+
+    def _track_hands(self) -> List[List[tuple]]:
+        now = time.perf_counter()
+        # Each station has its own capture time, so latency checkpoints aren't attached here
+        self._frame_timestamps = {}
+        for station, camera in enumerate(self.cameras):
+            frame, captured_at = camera.read_with_timestamp()
+            if frame is None or captured_at == self._last_captured[station]:
+                continue
+            self._last_captured[station] = captured_at
+            self._frames_seen[station] += 1
+            if self._frames_seen[station] % self.quality.inference_interval == 0:
+                self.pool.submit(station, frame, captured_at)
+
+        for station, captured_at, hands in self.pool.poll():
+            self.extrapolator.update(station, hands[0][1] if hands else [], captured_at)
+        return [self.extrapolator.predict(i, now) for i in range(len(self.players))]
+
+    def _render_sidebar_panel(self, sidebar_x: int):
+        # No previews: the sidebar shows how the shared pool is serving each station
+        title = self.font.render(f"{self.pool.workers} tracker processes", True, (255, 255, 255))
+        self.screen.blit(title, (sidebar_x, 20))
+        small = pygame.font.SysFont("Arial", 14)
+        for station in range(len(self.players)):
+            line = f"P{station + 1}: {self.pool.completed[station]} tracked, {self.pool.dropped[station]} dropped"
+            if self.pool.is_down(station):
+                line = f"P{station + 1}: tracker down"
+            self.screen.blit(small.render(line, True, (150, 150, 150)), (sidebar_x, 60 + station * 20))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PyBite cabinet: several camera stations, one tracking pool")
+    parser.add_argument("--camera", action="append", required=True,
+                        help="Camera index or video file for one station; repeat per station")
+    parser.add_argument("--workers", type=int, default=None, help="Tracker processes (default: cores - 1)")
+    parser.add_argument("--fixed-quality", action="store_true", help="Disable the adaptive quality governor")
+    parser.add_argument("--powerups", action="store_true", help="Spawn timed bonus food, speed tiles and walls")
+    parser.add_argument("--scores", default=DEFAULT_SCORES_PATH, help="SQLite file for high scores and session stats")
+    args = parser.parse_args()
+
+    sources = [int(c) if c.isdigit() else c for c in args.camera]
+    app = CabinetApp(sources, workers=args.workers, adaptive_quality=not args.fixed_quality,
+                     powerups=args.powerups, scores_path=args.scores)
+    app.run()
@@ -0,0 +1,64 @@
+import time
+from typing import Dict
+
+import numpy as np
+
+from vision.gesture_classifier import DIRECTIONS, GestureModel, GestureSamples, LearnedGestureInterpreter, synthetic_samples
+from vision.gesture_interpreter import GestureInterpreter
+
+def run_gesture_benchmark(model: GestureModel, samples: GestureSamples) -> Dict[str, Dict[str, float]]:
+    """
+    Classifies every sample one hand at a time, as the live loop does, with both the
+    heuristic GestureInterpreter and the learned model. Reports per-head accuracy
+    (unlabelled heads skipped) and per-hand latency in microseconds.
+    """
+    hands = [[tuple(point) for point in hand] for hand in samples.landmarks.tolist()]
+    truth = {"direction": samples.direction, "pinch": samples.phase, "fist": samples.boost}
+    results = {}
+
+    for name, interpreter in (("heuristic", GestureInterpreter()), ("learned", LearnedGestureInterpreter(model))):
+        predicted = {"direction": [], "pinch": [], "fist": []}
+        timings = []
+        for landmarks in hands:
+            start = time.perf_counter()
+            command = interpreter.classify(landmarks)
+            timings.append(time.perf_counter() - start)
+            predicted["direction"].append(DIRECTIONS.index(command["direction"]))
+            predicted["pinch"].append(command["phase"])
+            predicted["fist"].append(command["boost"])
+
+        stats = {}
+        for head, labels in truth.items():
+            labelled = labels >= 0
+            stats[f"{head}_accuracy"] = float(np.mean(np.array(predicted[head])[labelled] == labels[labelled]))
+        timings.sort()
+        stats["p50_us"] = timings[len(timings) // 2] * 1e6
+        stats["p99_us"] = timings[min(len(timings) - 1, int(0.99 * len(timings)))] * 1e6
+        results[name] = stats
+
+    return results
+
+def format_report(results: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'':<10} {'direction':>9} {'pinch':>7} {'fist':>7} {'p50':>9} {'p99':>9}"]
+    for name, s in results.items():
+        lines.append(f"{name:<10} {s['direction_accuracy']:>9.3f} {s['pinch_accuracy']:>7.3f} {s['fist_accuracy']:>7.3f} "
+                     f"{s['p50_us']:>7.1f}us {s['p99_us']:>7.1f}us")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Heuristic vs learned gesture classification: accuracy and latency")
+    parser.add_argument("samples", nargs="*", help="Labelled samples (.npz); synthetic hands if none are given")
+    parser.add_argument("--model", help="Trained model (.npz); trained on the first 80%% of the samples if omitted")
+    parser.add_argument("--count", type=int, default=10000, help="Synthetic samples to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = GestureSamples.load(*args.samples) if args.samples else synthetic_samples(args.count, seed=args.seed)
+    if args.model:
+        gesture_model, test_set = GestureModel.load(args.model), data
+    else:
+        train_set, test_set = data.split(seed=args.seed)
+        gesture_model = GestureModel.train(train_set)
+    print(format_report(run_gesture_benchmark(gesture_model, test_set)))
@@ -1,6 +1,8 @@
 import sys
 import os
 import time
+import random
+import argparse
 
 # Add project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -8,53 +10,80 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pygame
 import cv2
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from game.engine import GameEngine
+from game.replay import CommandRecorder, player_log_path
+from game.autopilot import Autopilot
 from vision.camera import Camera
 from vision.hand_tracker import HandTracker
 from vision.gesture_interpreter import GestureInterpreter
+from vision.gesture_classifier import GestureModel, LearnedGestureInterpreter
+from vision.hand_assigner import HandAssigner
+from vision.landmark_extrapolator import LandmarkExtrapolator
+from core.quality_governor import QualityGovernor, QualityLevel
+from core.latency import LatencyTracker
+from core.telemetry import setup_logging, telemetry
+from core.score_store import ScoreStore
 from core.event_types import GameStatus, GameCommand
+from app.renderer import GameRenderer, PlayerSlot, GRID_SIZE, CAMERA_DISPLAY_WIDTH
 
-# --- Configuration ---
-CELL_SIZE = 30
-GRID_SIZE = (20, 20)
-GRID_WIDTH = GRID_SIZE[0] * CELL_SIZE
-GRID_HEIGHT = GRID_SIZE[1] * CELL_SIZE
-SIDEBAR_WIDTH = 250
-WINDOW_WIDTH = GRID_WIDTH + SIDEBAR_WIDTH
-WINDOW_HEIGHT = GRID_HEIGHT + 100 
-CAMERA_DISPLAY_WIDTH = 220
+DEFAULT_SCORES_PATH = os.path.join(os.path.expanduser("~"), ".pybite_scores.db")
 
-# Colors
-COLOR_BG = (20, 20, 30)
-COLOR_SNAKE = (0, 255, 127)
-COLOR_SNAKE_HEAD = (255, 255, 255)
-COLOR_PHASE = (138, 43, 226) # Purple for phase mode
-COLOR_FOOD = (255, 69, 0)
-COLOR_UI_TEXT = (200, 200, 200)
-COLOR_UI_BAR_BG = (50, 50, 70)
-COLOR_BOOST = (0, 191, 255)
-
-class PyBiteApp:
-    def __init__(self):
+class PyBiteApp(GameRenderer):
+    def __init__(self, record_path: str = None, autopilot: bool = False, players: int = 1,
+                 adaptive_quality: bool = True, camera_source=0, powerups: bool = False,
+                 scores_path: str = DEFAULT_SCORES_PATH, gesture_model: str = None):
+        # Log records are written by a background thread so the frame loop never waits on I/O
+        self.log_listener = setup_logging()
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        screen = pygame.display.set_mode(GameRenderer.window_size(players))
         pygame.display.set_caption("PyBite – Gesture Controlled Arcade")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("Arial", 24)
-        self.font_big = pygame.font.SysFont("Arial", 48, bold=True)
         
         # Game & Vision
-        self.engine = GameEngine(board_size=GRID_SIZE)
-        self.camera = Camera().start()
-        self.tracker = HandTracker()
-        self.interpreter = GestureInterpreter()
+        # High scores and per-game stats go to SQLite from a background thread
+        self.scores = ScoreStore(scores_path)
+        # Players share a seed so everyone gets the same food sequence
+        seed = random.randrange(2**32)
+        slots = [
+            PlayerSlot(GameEngine(board_size=GRID_SIZE, seed=seed, powerups=powerups, score_store=self.scores), i)
+            for i in range(players)
+        ]
+        # Quality governor: steps the vision/render cost down on slow machines and back up when there's headroom
+        super().__init__(screen, slots, QualityGovernor(target_frame_time=1 / 30, adaptive=adaptive_quality))
+        self.record_path = record_path
+        # Every board is its own seeded engine, so each player gets an independently replayable log
+        self.recorders = [CommandRecorder(p.engine) for p in self.players] if record_path else []
+        self.autopilot = Autopilot() if autopilot else None
+        self._start_vision(camera_source, players)
+        if gesture_model:
+            self.interpreter = LearnedGestureInterpreter(GestureModel.load(gesture_model))
+        else:
+            self.interpreter = GestureInterpreter()
+        self.extrapolator = LandmarkExtrapolator()
+        
+        self._preview_surface = None
+        self._apply_quality(self.governor.level)
+        
+        # Input latency: each frame's checkpoints ride along with its commands until the turn is drawn
+        self.latency = LatencyTracker()
+        self._frame_timestamps = {}
+        self._landed_turns = []
+        for player in self.players:
+            player.engine.turn_listener = self._on_turn
         
         self.running = True
-        self.debug_gestures = {}
-        self._ready_to_restart = False
         
+    def _start_vision(self, camera_source, players: int):
+        self.camera = Camera(camera_source).start()
+        # One tracking pass finds every player's hand
+        self.tracker = HandTracker(max_num_hands=players)
+        self.assigner = HandAssigner(num_players=players) if players > 1 else None
+
+    def _stop_vision(self):
+        self.camera.stop()
+
     def _handle_keyboard_fallback(self) -> Dict[str, Any]:
         """Allows keyboard control for testing."""
         keys = pygame.key.get_pressed()
@@ -71,126 +100,20 @@ class PyBiteApp:
             
         return cmd
 
-    def _render_game(self, state):
-        self.screen.fill(COLOR_BG)
-        
-        # 1. Draw Food
-        if state.food_position:
-            food_rect = (
-                state.food_position.x * CELL_SIZE,
-                state.food_position.y * CELL_SIZE,
-                CELL_SIZE, CELL_SIZE
-            )
-            pygame.draw.circle(
-                self.screen, COLOR_FOOD, 
-                (food_rect[0] + CELL_SIZE//2, food_rect[1] + CELL_SIZE//2), 
-                CELL_SIZE//2 - 2
-            )
-        
-        # 2. Draw Snake
-        snake_color = COLOR_PHASE if state.phase_active else COLOR_SNAKE
-        for i, segment in enumerate(state.snake_body):
-            rect = (segment.x * CELL_SIZE, segment.y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-            color = COLOR_SNAKE_HEAD if i == 0 else snake_color
-            pygame.draw.rect(self.screen, color, rect, border_radius=5)
-            # Inner detail for segments
-            pygame.draw.rect(self.screen, (0,0,0), rect, 1, border_radius=5)
-            
-        # 3. Draw UI
-        self._render_ui(state)
-        
-        # 4. Draw Camera Feedback Overlay
-        self._render_camera_overlay()
-        
-        # 5. Handle States
-        if state.status == GameStatus.GAME_OVER:
-            self._render_overlay_text("GAME OVER", "Wait 1s then Fist to Restart")
-        elif state.status == GameStatus.MENU:
-            self._render_overlay_text("PYBITE", "Show Hand to Start")
-            
-        # 6. Flash effect for PHASE mode
-        if state.phase_active:
-             flash = pygame.Surface((GRID_WIDTH, GRID_HEIGHT), pygame.SRCALPHA)
-             flash.fill((138, 43, 226, 40)) # Translucent purple
-             self.screen.blit(flash, (0,0))
-
-    def _render_ui(self, state):
-        # Background bar
-        pygame.draw.rect(self.screen, COLOR_UI_BAR_BG, (0, GRID_HEIGHT, WINDOW_WIDTH, 100))
-        
-        # Score
-        score_txt = self.font.render(f"S: {state.score}", True, COLOR_UI_TEXT)
-        self.screen.blit(score_txt, (10, GRID_HEIGHT + 20))
-        level_txt = self.font.render(f"L: {int((state.difficulty-1)*10)+1}", True, COLOR_UI_TEXT)
-        self.screen.blit(level_txt, (10, GRID_HEIGHT + 55))
-        
-        # Phase Cooldown Meter
-        cd_width = 150
-        meter_x = WINDOW_WIDTH - 170
-        pygame.draw.rect(self.screen, (30, 30, 30), (meter_x, GRID_HEIGHT + 20, cd_width, 20))
-        if state.phase_cooldown <= 0:
-            pygame.draw.rect(self.screen, COLOR_PHASE, (meter_x, GRID_HEIGHT + 20, cd_width, 20))
-        else:
-            progress = 1.0 - (state.phase_cooldown / 10.0)
-            pygame.draw.rect(self.screen, (100, 100, 100), (meter_x, GRID_HEIGHT + 20, int(cd_width * progress), 20))
-        self.screen.blit(self.font.render("PHASE", True, COLOR_UI_TEXT), (meter_x, GRID_HEIGHT + 45))
-
-        # Boost Meter
-        pygame.draw.rect(self.screen, (30, 30, 30), (meter_x, GRID_HEIGHT + 70, cd_width, 10))
-        pygame.draw.rect(self.screen, COLOR_BOOST, (meter_x, GRID_HEIGHT + 70, int(cd_width * (state.boost_meter/100)), 10))
-
-        # --- Gesture Indicators ---
-        self._render_gesture_indicators()
-
-    def _render_gesture_indicators(self):
-        """Draws visual icons for detected gestures in the bottom panel."""
-        panel_y = GRID_HEIGHT + 10
-        start_x = 100
-        spacing = 45
-        
-        # Show raw offsets for debugging direction issues
-        if self.debug_gestures and "raw" in self.debug_gestures:
-             raw = self.debug_gestures["raw"]
-             off_txt = f"dx: {raw[0]:.2f} dy: {raw[1]:.2f}"
-             off_surf = pygame.font.SysFont("Arial", 12).render(off_txt, True, (255, 255, 0))
-             self.screen.blit(off_surf, (WINDOW_WIDTH // 2 - 30, GRID_HEIGHT + 80))
-
-        gestures = [
-            ("↑", "direction", "UP"),
-            ("↓", "direction", "DOWN"),
-            ("←", "direction", "LEFT"),
-            ("→", "direction", "RIGHT"),
-            ("P", "phase", True),
-            ("B", "boost", True)
-        ]
-        
-        for i, (label, key, active_val) in enumerate(gestures):
-            is_active = self.debug_gestures.get(key) == active_val
-            color = (255, 255, 255) if is_active else (80, 80, 100)
-            bg_color = (0, 200, 0) if is_active else (40, 40, 60)
-            
-            rect = (start_x + i * spacing, panel_y, 40, 40)
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=8)
-            
-            txt_surf = self.font.render(label, True, color)
-            self.screen.blit(txt_surf, (rect[0] + 20 - txt_surf.get_width()//2, rect[1] + 20 - txt_surf.get_height()//2))
-            
-            # Label below icons
-            hint_map = {"UP": "Dir", "DOWN": " ", "LEFT": " ", "RIGHT": " ", "phase": "PHASE", "boost": "BST"}
-            hint = hint_map.get(active_val if key == "direction" else key, "")
-            if hint:
-                hint_surf = pygame.font.SysFont("Arial", 12).render(hint, True, COLOR_UI_TEXT)
-                self.screen.blit(hint_surf, (rect[0] + 20 - hint_surf.get_width()//2, rect[1] + 45))
+    def _apply_quality(self, level: QualityLevel):
+        """Pushes a quality level out to the tracker, camera and renderer."""
+        self.quality = level
+        self.tracker.set_model_complexity(level.model_complexity)
+        self.tracker.inference_scale = level.inference_scale
+        self.camera.set_capture(*level.capture_size, level.capture_fps)
 
-    def _render_camera_overlay(self):
+    def _render_sidebar_panel(self, sidebar_x: int):
+        """Camera preview with tracked landmarks, and the current gesture as text."""
         frame = self.camera.read()
-        sidebar_x = GRID_WIDTH + (SIDEBAR_WIDTH - CAMERA_DISPLAY_WIDTH) // 2
-        
-        # Draw Sidebar background for contrast
-        pygame.draw.rect(self.screen, (10, 10, 20), (GRID_WIDTH, 0, SIDEBAR_WIDTH, GRID_HEIGHT))
-        pygame.draw.line(self.screen, (50, 50, 70), (GRID_WIDTH, 0), (GRID_WIDTH, GRID_HEIGHT), 2)
-
-        if frame is not None:
+        if frame is None:
+            return
+        # The preview is rebuilt only every Nth frame at lower quality levels
+        if self._preview_surface is None or self.frame_index % self.quality.preview_interval == 0:
             # Draw landmarks for visual feedback
             self.tracker.draw_landmarks(frame)
             
@@ -199,103 +122,172 @@ class PyBiteApp:
 
             # Convert BGR to RGB for Pygame
             frame_rgb = cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB)
-            frame_surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-            self.screen.blit(frame_surface, (sidebar_x, 20))
+            self._preview_surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
+        self.screen.blit(self._preview_surface, (sidebar_x, 20))
+        
+        if self.debug_gestures:
+            self._render_gesture_status(sidebar_x)
+
+    def _handle_restart(self, player: PlayerSlot, commands: Dict[str, Any], restart_key: bool):
+        """Menu/Restart with debounce and 1s safety delay."""
+        engine = player.engine
+        if engine.state.status != GameStatus.PLAYING:
+            # Add a cooldown so they don't instant-restart
+            if player.game_over_time is None:
+                player.game_over_time = time.time()
             
-            # Draw gesture status text in sidebar
-            if self.debug_gestures:
-                dir_txt = f"Direction: {self.debug_gestures.get('direction') or 'None'}"
-                boost_txt = f"Boost: {'ACTIVE' if self.debug_gestures.get('boost') else 'Off'}"
+            # User must release the fist/R key and then press it again after 1s
+            if not commands.get("boost") and not restart_key:
+                player.ready_to_restart = True
                 
-                dir_surf = self.font.render(dir_txt, True, (0, 255, 0))
-                bst_surf = self.font.render(boost_txt, True, (0, 191, 255))
-                
-                self.screen.blit(dir_surf, (sidebar_x, 190))
-                self.screen.blit(bst_surf, (sidebar_x, 220))
-                
-        # Instructions legend
-        legend_y = 280
-        legend_items = [
-            ("Index vs Wrist", "Move Snake"),
-            ("Pinch", "PHASE Mode"),
-            ("Fist", "Speed Boost"),
-            ("Fist (Over)", "Restart Game")
-        ]
-        for i, (act, res) in enumerate(legend_items):
-            pygame.draw.circle(self.screen, (0, 255, 0), (sidebar_x + 10, legend_y + i*45 + 10), 4)
-            a_surf = pygame.font.SysFont("Arial", 14, bold=True).render(act, True, (255,255,255))
-            r_surf = pygame.font.SysFont("Arial", 14).render(res, True, (150,150,150))
-            self.screen.blit(a_surf, (sidebar_x + 25, legend_y + i*45))
-            self.screen.blit(r_surf, (sidebar_x + 25, legend_y + i*45 + 18))
+            if player.ready_to_restart and (time.time() - player.game_over_time > 1.5):
+                if commands.get("boost") or restart_key:
+                    print("Restarting game via gesture/key...")
+                    engine.reset()
+                    player.ready_to_restart = False
+                    player.game_over_time = None
+        else:
+            player.game_over_time = None
 
-    def _render_overlay_text(self, title: str, subtitle: str):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0,0))
-        
-        title_surf = self.font_big.render(title, True, (255, 255, 255))
-        sub_surf = self.font.render(subtitle, True, (200, 200, 200))
-        
-        self.screen.blit(title_surf, (WINDOW_WIDTH//2 - title_surf.get_width()//2, WINDOW_HEIGHT//3))
-        self.screen.blit(sub_surf, (WINDOW_WIDTH//2 - sub_surf.get_width()//2, WINDOW_HEIGHT//3 + 70))
+    def _track_session(self, player: PlayerSlot, commands: Dict[str, Any]):
+        """Follows the engine's status: a game that has just ended is queued for the score store."""
+        session = player.session
+        playing = player.engine.state.status == GameStatus.PLAYING
+        if playing and not session.running:
+            session.start()
+        elif session.running and not playing:
+            self.scores.record(session.finish(player.engine.state.score))
+            self.scores.flush()
+        if session.running:
+            session.on_commands(commands)
+
+    def _track_hands(self) -> List[List[tuple]]:
+        """Runs hand tracking on every Nth frame and extrapolates landmarks on the rest."""
+        frame, captured_at = self.camera.read_with_timestamp()
+        now = time.perf_counter()
+        self._frame_timestamps = {}
+        if frame is None:
+            return [[] for _ in self.players]
+            
+        if self.frame_index % self.quality.inference_interval == 0:
+            self.tracker.find_hands(frame)
+            if self.assigner:
+                landmark_sets = self.assigner.assign(self.tracker.get_hands())
+            else:
+                landmark_sets = [self.tracker.get_landmarks()]
+            for i, landmarks in enumerate(landmark_sets):
+                self.extrapolator.update(i, landmarks, now)
+        else:
+            landmark_sets = [self.extrapolator.predict(i, now) for i in range(len(self.players))]
+            
+        self._frame_timestamps = {"captured": captured_at, "tracked": time.perf_counter()}
+        return landmark_sets
+
+    def _on_turn(self, timestamps: Dict[str, float]):
+        """Engine callback: a gesture-driven turn has just moved the snake."""
+        self._landed_turns.append(dict(timestamps, moved=time.perf_counter()))
 
     def run(self):
-        self.engine.reset()
+        for player in self.players:
+            player.engine.reset()
         
         while self.running:
+            self.governor.begin_frame()
+            
             # 1. Input Processing
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                    telemetry.dump()
             
-            # 2. Vision Processing
-            frame = self.camera.read()
-            landmarks = []
-            if frame is not None:
-                self.tracker.find_hands(frame)
-                landmarks = self.tracker.get_landmarks()
+            # 2. Vision Processing: one tracking pass, then one landmark set per player
+            with self.governor.stage("vision"):
+                landmark_sets = self._track_hands()
             
-            commands = self.interpreter.get_command(landmarks)
-            self.debug_gestures = commands
+            all_commands = self.interpreter.get_commands(landmark_sets)
+            if self._frame_timestamps:
+                interpreted_at = time.perf_counter()
+                for commands in all_commands:
+                    commands["timestamps"] = dict(self._frame_timestamps, interpreted=interpreted_at)
+            if self.autopilot:
+                # Attract mode: the built-in controller drives instead of player 1
+                all_commands[0] = self.autopilot.get_command(self.engine.state)
             
-            # Handle Menu/Restart with debounce and 1s safety delay
-            if self.engine.state.status != GameStatus.PLAYING:
-                # Add a cooldown so they don't instant-restart
-                if not hasattr(self, "_game_over_time"):
-                    self._game_over_time = time.time()
-                
-                # User must release the fist/R key and then press it again after 1s
-                if not commands.get("boost") and not pygame.key.get_pressed()[pygame.K_r]:
-                    self._ready_to_restart = True
-                    
-                if self._ready_to_restart and (time.time() - self._game_over_time > 1.5):
-                    if commands.get("boost") or pygame.key.get_pressed()[pygame.K_r]:
-                        print("Restarting game via gesture/key...")
-                        self.engine.reset()
-                        self._ready_to_restart = False
-                        delattr(self, "_game_over_time")
-            else:
-                if hasattr(self, "_game_over_time"):
-                    delattr(self, "_game_over_time")
+            restart_key = pygame.key.get_pressed()[pygame.K_r]
+            for i, (player, commands) in enumerate(zip(self.players, all_commands)):
+                player.debug_gestures = commands
+                self._handle_restart(player, commands, restart_key and i == 0)
 
-            # Merge with keyboard fallback
+            # Merge with keyboard fallback (player 1)
             kb_commands = self._handle_keyboard_fallback()
             for key, val in kb_commands.items():
-                if val: commands[key] = val
+                if val: all_commands[0][key] = val
+            if kb_commands["direction"]:
+                # Keyboard turns didn't come from the camera frame
+                all_commands[0].pop("timestamps", None)
             
             # 3. Game Engine Update
-            self.engine.process_command(commands)
-            self.engine.update()
+            with self.governor.stage("engine"):
+                for player, commands in zip(self.players, all_commands):
+                    if "timestamps" in commands:
+                        commands["timestamps"]["commanded"] = time.perf_counter()
+                    player.engine.process_command(commands)
+                    player.engine.update()
+            for i, (player, commands) in enumerate(zip(self.players, all_commands)):
+                # Attract-mode games stay off the leaderboard
+                if not (self.autopilot and i == 0):
+                    self._track_session(player, commands)
             
             # 4. Rendering
-            self._render_game(self.engine.state)
-            pygame.display.flip()
+            with self.governor.stage("render"):
+                self._render_game(self.engine.state)
+                pygame.display.flip()
             
+            flipped_at = time.perf_counter()
+            for timestamps in self._landed_turns:
+                timestamps["flipped"] = flipped_at
+                self.latency.record(timestamps)
+            self._landed_turns.clear()
+            
+            # Frame time is measured before the limiter sleeps
+            if self.governor.end_frame():
+                self._apply_quality(self.governor.level)
+            for player in self.players:
+                if player.session.running:
+                    player.session.on_frame(self.governor.last_frame_time)
+            
+            telemetry.sample(time.perf_counter())
+            self.frame_index += 1
             self.clock.tick(30)
             
-        self.camera.stop()
+        self._stop_vision()
+        print("Input latency (capture -> screen):\n" + self.latency.report())
+        for i, recorder in enumerate(self.recorders):
+            recorder.save(player_log_path(self.record_path, i))
+        for player in self.players:
+            if player.session.running:
+                self.scores.record(player.session.finish(player.engine.state.score))
+        self.scores.close()
+        telemetry.dump()
+        self.log_listener.stop()
         pygame.quit()
 
 if __name__ == "__main__":
-    app = PyBiteApp()
+    parser = argparse.ArgumentParser(description="PyBite – Gesture Controlled Arcade")
+    parser.add_argument("--record", metavar="PATH", help="Record a replayable command log to PATH (player 2: PATH with a .p2 suffix)")
+    parser.add_argument("--autopilot", action="store_true", help="Attract mode: let the built-in AI play")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1, help="Players sharing the camera")
+    parser.add_argument("--fixed-quality", action="store_true", help="Disable the adaptive quality governor")
+    parser.add_argument("--camera", default="0", help="Camera index, or a recorded video to play back instead")
+    parser.add_argument("--powerups", action="store_true", help="Spawn timed bonus food, speed tiles and walls")
+    parser.add_argument("--gesture-model", metavar="PATH", help="Classify gestures with a trained model instead of the rules")
+    parser.add_argument("--scores", default=DEFAULT_SCORES_PATH, help="SQLite file for high scores and session stats")
+    args = parser.parse_args()
+    
+    camera_source = int(args.camera) if args.camera.isdigit() else args.camera
+    app = PyBiteApp(record_path=args.record, autopilot=args.autopilot, players=args.players,
+                    adaptive_quality=not args.fixed_quality, camera_source=camera_source,
+                    powerups=args.powerups, scores_path=args.scores,
+                    gesture_model=args.gesture_model)
     app.run()
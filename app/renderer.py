@@ -0,0 +1,270 @@
+import pygame
+from typing import Any, Dict, List, Tuple
+
+from game.engine import GameEngine
+from core.quality_governor import QualityGovernor
+from core.score_store import SessionStats
+from core.event_types import GameStatus, ItemKind
+
+# --- Configuration ---
+CELL_SIZE = 30
+GRID_SIZE = (20, 20)
+GRID_WIDTH = GRID_SIZE[0] * CELL_SIZE
+GRID_HEIGHT = GRID_SIZE[1] * CELL_SIZE
+SIDEBAR_WIDTH = 250
+WINDOW_WIDTH = GRID_WIDTH + SIDEBAR_WIDTH
+WINDOW_HEIGHT = GRID_HEIGHT + 100 
+CAMERA_DISPLAY_WIDTH = 220
+
+# Colors
+COLOR_BG = (20, 20, 30)
+COLOR_SNAKE = (0, 255, 127)
+COLOR_SNAKE_HEAD = (255, 255, 255)
+COLOR_PHASE = (138, 43, 226) # Purple for phase mode
+COLOR_FOOD = (255, 69, 0)
+COLOR_UI_TEXT = (200, 200, 200)
+COLOR_UI_BAR_BG = (50, 50, 70)
+COLOR_BOOST = (0, 191, 255)
+COLOR_BONUS_FOOD = (255, 215, 0)
+COLOR_SPEED_TILE = (0, 120, 255)
+COLOR_WALL = (120, 120, 140)
+
+class PlayerSlot:
+    """One player's engine plus the gesture feedback and restart debounce that go with it."""
+    
+    def __init__(self, engine: GameEngine, player: int = 0):
+        self.engine = engine
+        self.session = SessionStats(player)
+        self.debug_gestures = {}
+        self.ready_to_restart = False
+        self.game_over_time = None
+
+class GameRenderer:
+    """
+    Draws the boards, bottom HUD and sidebar onto a surface.
+
+    Holds only what drawing needs, so the live app and the off-screen replay
+    exporter are built from the same state. Subclasses fill in the sidebar panel.
+    """
+
+    def __init__(self, screen: pygame.Surface, players: List[PlayerSlot], governor: QualityGovernor):
+        self.screen = screen
+        self.players = players
+        self.engine = players[0].engine
+        # Boards sit side by side, one per player, with the sidebar on the right
+        self.boards_width = GRID_WIDTH * len(players)
+        self.window_width = self.boards_width + SIDEBAR_WIDTH
+        self.font = pygame.font.SysFont("Arial", 24)
+        self.font_big = pygame.font.SysFont("Arial", 48, bold=True)
+        self.governor = governor
+        self.quality = governor.level
+        self.frame_index = 0
+
+    @staticmethod
+    def window_size(players: int) -> Tuple[int, int]:
+        return GRID_WIDTH * players + SIDEBAR_WIDTH, WINDOW_HEIGHT
+
+    @property
+    def debug_gestures(self) -> Dict[str, Any]:
+        """Gesture feedback shown in the HUD and sidebar (player 1)."""
+        return self.players[0].debug_gestures
+
+    def _render_game(self, state):
+        self.screen.fill(COLOR_BG)
+        
+        # 1-2. Draw each player's board; the primary state always goes first
+        states = [state] + [p.engine.state for p in self.players[1:]]
+        for i, board_state in enumerate(states):
+            board = self.screen.subsurface((i * GRID_WIDTH, 0, GRID_WIDTH, GRID_HEIGHT))
+            self._render_board(board, board_state)
+            
+        # 3. Draw UI
+        self._render_ui(state)
+        for i, board_state in enumerate(states[1:], start=1):
+            self._render_player_hud(board_state, i)
+        
+        # 4. Draw Sidebar
+        self._render_sidebar()
+        
+        # 5. Handle States
+        if len(states) == 1:
+            if state.status == GameStatus.GAME_OVER:
+                self._render_overlay_text("GAME OVER", "Wait 1s then Fist to Restart")
+            elif state.status == GameStatus.MENU:
+                self._render_overlay_text("PYBITE", "Show Hand to Start")
+        else:
+            for i, board_state in enumerate(states):
+                if board_state.status == GameStatus.GAME_OVER:
+                    board = self.screen.subsurface((i * GRID_WIDTH, 0, GRID_WIDTH, GRID_HEIGHT))
+                    self._render_overlay_text(f"P{i + 1} GAME OVER", "Fist to Restart", surface=board)
+
+    def _render_board(self, surface, state):
+        """Draws food, board items, snake and phase flash onto a board-sized surface."""
+        # 1. Draw Food
+        if state.food_position:
+            food_rect = (
+                state.food_position.x * CELL_SIZE,
+                state.food_position.y * CELL_SIZE,
+                CELL_SIZE, CELL_SIZE
+            )
+            pygame.draw.circle(
+                surface, COLOR_FOOD, 
+                (food_rect[0] + CELL_SIZE//2, food_rect[1] + CELL_SIZE//2), 
+                CELL_SIZE//2 - 2
+            )
+        
+        # 2. Draw timed board items
+        for item in state.board_items:
+            rect = (item.position.x * CELL_SIZE, item.position.y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+            if item.kind == ItemKind.BONUS_FOOD:
+                center = (rect[0] + CELL_SIZE//2, rect[1] + CELL_SIZE//2)
+                pygame.draw.circle(surface, COLOR_BONUS_FOOD, center, CELL_SIZE//2 - 2)
+            elif item.kind == ItemKind.SPEED_TILE:
+                pygame.draw.rect(surface, COLOR_SPEED_TILE, rect, 3, border_radius=5)
+            else:
+                pygame.draw.rect(surface, COLOR_WALL, rect)
+        
+        # 3. Draw Snake
+        snake_color = COLOR_PHASE if state.phase_active else COLOR_SNAKE
+        for i, segment in enumerate(state.snake_body):
+            rect = (segment.x * CELL_SIZE, segment.y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+            color = COLOR_SNAKE_HEAD if i == 0 else snake_color
+            pygame.draw.rect(surface, color, rect, border_radius=5)
+            # Inner detail for segments
+            pygame.draw.rect(surface, (0,0,0), rect, 1, border_radius=5)
+            
+        # 4. Flash effect for PHASE mode
+        if state.phase_active and self.quality.effects:
+             flash = pygame.Surface((GRID_WIDTH, GRID_HEIGHT), pygame.SRCALPHA)
+             flash.fill((138, 43, 226, 40)) # Translucent purple
+             surface.blit(flash, (0,0))
+
+    def _render_ui(self, state):
+        # Background bar
+        pygame.draw.rect(self.screen, COLOR_UI_BAR_BG, (0, GRID_HEIGHT, self.window_width, 100))
+        
+        # Score
+        score_txt = self.font.render(f"S: {state.score}", True, COLOR_UI_TEXT)
+        self.screen.blit(score_txt, (10, GRID_HEIGHT + 20))
+        level_txt = self.font.render(f"L: {int((state.difficulty-1)*10)+1}", True, COLOR_UI_TEXT)
+        self.screen.blit(level_txt, (10, GRID_HEIGHT + 55))
+        
+        # Phase Cooldown Meter
+        cd_width = 150
+        meter_x = self.window_width - 170
+        pygame.draw.rect(self.screen, (30, 30, 30), (meter_x, GRID_HEIGHT + 20, cd_width, 20))
+        if state.phase_cooldown <= 0:
+            pygame.draw.rect(self.screen, COLOR_PHASE, (meter_x, GRID_HEIGHT + 20, cd_width, 20))
+        else:
+            progress = 1.0 - (state.phase_cooldown / 10.0)
+            pygame.draw.rect(self.screen, (100, 100, 100), (meter_x, GRID_HEIGHT + 20, int(cd_width * progress), 20))
+        self.screen.blit(self.font.render("PHASE", True, COLOR_UI_TEXT), (meter_x, GRID_HEIGHT + 45))
+
+        # Boost Meter
+        pygame.draw.rect(self.screen, (30, 30, 30), (meter_x, GRID_HEIGHT + 70, cd_width, 10))
+        pygame.draw.rect(self.screen, COLOR_BOOST, (meter_x, GRID_HEIGHT + 70, int(cd_width * (state.boost_meter/100)), 10))
+        
+        # Current quality level and smoothed frame time
+        quality_txt = f"Q: {self.quality.name} {self.governor.frame_time * 1000:.0f}ms"
+        quality_surf = pygame.font.SysFont("Arial", 12).render(quality_txt, True, COLOR_UI_TEXT)
+        self.screen.blit(quality_surf, (meter_x, GRID_HEIGHT + 83))
+
+        # --- Gesture Indicators ---
+        self._render_gesture_indicators()
+
+    def _render_player_hud(self, state, player: int):
+        """Compact score and meters for additional players, under their own board."""
+        x = player * GRID_WIDTH + 10
+        label = self.font.render(f"P{player + 1} S: {state.score}", True, COLOR_UI_TEXT)
+        self.screen.blit(label, (x, GRID_HEIGHT + 55))
+        
+        phase_color = COLOR_PHASE if state.phase_cooldown <= 0 else (100, 100, 100)
+        pygame.draw.rect(self.screen, phase_color, (x + 140, GRID_HEIGHT + 60, 60, 8))
+        pygame.draw.rect(self.screen, COLOR_BOOST, (x + 140, GRID_HEIGHT + 75, int(60 * (state.boost_meter/100)), 8))
+
+    def _render_gesture_indicators(self):
+        """Draws visual icons for detected gestures in the bottom panel."""
+        panel_y = GRID_HEIGHT + 10
+        start_x = 100
+        spacing = 45
+        
+        # Show raw offsets for debugging direction issues
+        if self.debug_gestures and "raw" in self.debug_gestures:
+             raw = self.debug_gestures["raw"]
+             off_txt = f"dx: {raw[0]:.2f} dy: {raw[1]:.2f}"
+             off_surf = pygame.font.SysFont("Arial", 12).render(off_txt, True, (255, 255, 0))
+             self.screen.blit(off_surf, (self.window_width // 2 - 30, GRID_HEIGHT + 80))
+
+        gestures = [
+            ("↑", "direction", "UP"),
+            ("↓", "direction", "DOWN"),
+            ("←", "direction", "LEFT"),
+            ("→", "direction", "RIGHT"),
+            ("P", "phase", True),
+            ("B", "boost", True)
+        ]
+        
+        for i, (label, key, active_val) in enumerate(gestures):
+            is_active = self.debug_gestures.get(key) == active_val
+            color = (255, 255, 255) if is_active else (80, 80, 100)
+            bg_color = (0, 200, 0) if is_active else (40, 40, 60)
+            
+            rect = (start_x + i * spacing, panel_y, 40, 40)
+            pygame.draw.rect(self.screen, bg_color, rect, border_radius=8)
+            
+            txt_surf = self.font.render(label, True, color)
+            self.screen.blit(txt_surf, (rect[0] + 20 - txt_surf.get_width()//2, rect[1] + 20 - txt_surf.get_height()//2))
+            
+            # Label below icons
+            hint_map = {"UP": "Dir", "DOWN": " ", "LEFT": " ", "RIGHT": " ", "phase": "PHASE", "boost": "BST"}
+            hint = hint_map.get(active_val if key == "direction" else key, "")
+            if hint:
+                hint_surf = pygame.font.SysFont("Arial", 12).render(hint, True, COLOR_UI_TEXT)
+                self.screen.blit(hint_surf, (rect[0] + 20 - hint_surf.get_width()//2, rect[1] + 45))
+
+    def _render_sidebar(self):
+        """Sidebar background, the subclass's panel on top and the gesture legend under it."""
+        sidebar_x = self.boards_width + (SIDEBAR_WIDTH - CAMERA_DISPLAY_WIDTH) // 2
+        pygame.draw.rect(self.screen, (10, 10, 20), (self.boards_width, 0, SIDEBAR_WIDTH, GRID_HEIGHT))
+        pygame.draw.line(self.screen, (50, 50, 70), (self.boards_width, 0), (self.boards_width, GRID_HEIGHT), 2)
+        self._render_sidebar_panel(sidebar_x)
+        self._render_legend(sidebar_x)
+
+    def _render_sidebar_panel(self, sidebar_x: int):
+        """Top of the sidebar, above the legend (camera preview in the live app)."""
+
+    def _render_gesture_status(self, sidebar_x: int):
+        """Direction and boost of player 1's latest command, as text."""
+        dir_txt = f"Direction: {self.debug_gestures.get('direction') or 'None'}"
+        boost_txt = f"Boost: {'ACTIVE' if self.debug_gestures.get('boost') else 'Off'}"
+        self.screen.blit(self.font.render(dir_txt, True, (0, 255, 0)), (sidebar_x, 190))
+        self.screen.blit(self.font.render(boost_txt, True, (0, 191, 255)), (sidebar_x, 220))
+
+    def _render_legend(self, sidebar_x: int):
+        """Instructions legend under the camera preview."""
+        legend_y = 280
+        legend_items = [
+            ("Index vs Wrist", "Move Snake"),
+            ("Pinch", "PHASE Mode"),
+            ("Fist", "Speed Boost"),
+            ("Fist (Over)", "Restart Game")
+        ]
+        for i, (act, res) in enumerate(legend_items):
+            pygame.draw.circle(self.screen, (0, 255, 0), (sidebar_x + 10, legend_y + i*45 + 10), 4)
+            a_surf = pygame.font.SysFont("Arial", 14, bold=True).render(act, True, (255,255,255))
+            r_surf = pygame.font.SysFont("Arial", 14).render(res, True, (150,150,150))
+            self.screen.blit(a_surf, (sidebar_x + 25, legend_y + i*45))
+            self.screen.blit(r_surf, (sidebar_x + 25, legend_y + i*45 + 18))
+
+    def _render_overlay_text(self, title: str, subtitle: str, surface=None):
+        surface = surface or self.screen
+        width, height = surface.get_size()
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        surface.blit(overlay, (0,0))
+        
+        title_surf = self.font_big.render(title, True, (255, 255, 255))
+        sub_surf = self.font.render(subtitle, True, (200, 200, 200))
+        
+        surface.blit(title_surf, (width//2 - title_surf.get_width()//2, height//3))
+        surface.blit(sub_surf, (width//2 - sub_surf.get_width()//2, height//3 + 70))
@@ -0,0 +1,243 @@
+import random
+import logging
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.event_types import GameStatus
+from game.engine import GameEngine
+from game.replay import CommandLog, RESET_EVENT, decode_command
+from vision.gesture_interpreter import GestureInterpreter
+from vision.synthetic_source import synthetic_hand
+
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+Commands = Iterator[Optional[Dict[str, Any]]]  # One entry per tick; None means no input that tick
+
+
+class InvariantError(Exception):
+    """Raised when the engine's state breaks a game rule during a soak run."""
+
+    def __init__(self, tick: int, message: str):
+        super().__init__(f"Tick {tick}: {message}")
+        self.tick = tick
+
+
+def random_commands(rng: random.Random, turn_chance: float = 0.05) -> Commands:
+    """Occasional random turns, pinches and fists, fed straight to the engine."""
+    while True:
+        if rng.random() < turn_chance:
+            yield {"direction": rng.choice(DIRECTIONS), "phase": rng.random() < 0.05, "boost": rng.random() < 0.2}
+        else:
+            yield None
+
+def gesture_commands(rng: random.Random, turn_chance: float = 0.05) -> Commands:
+    """Random synthetic hands through GestureInterpreter every tick, so the vision-side path soaks too."""
+    interpreter = GestureInterpreter()
+    direction, pinch, fist = "UP", False, False
+    while True:
+        if rng.random() < turn_chance:
+            direction = rng.choice(DIRECTIONS)
+            pinch, fist = rng.random() < 0.05, rng.random() < 0.1
+        yield interpreter.get_command(synthetic_hand(direction, scale=rng.uniform(0.8, 1.2), pinch=pinch, fist=fist))
+
+def replayed_commands(log: CommandLog) -> Commands:
+    """A recorded session's inputs on their original ticks, looped. Resets are left to the harness."""
+    by_tick = {tick: decode_command(code) for tick, code in log.events if not code & RESET_EVENT}
+    period = max(1, log.final_tick)
+    tick = 0
+    while True:
+        yield by_tick.get(tick % period)
+        tick += 1
+
+
+@dataclass
+class SoakSample:
+    tick: int
+    memory: int  # Bytes traced by tracemalloc
+    tick_time: float  # Mean seconds per tick since the previous sample
+
+
+@dataclass
+class SoakReport:
+    ticks: int
+    games: int
+    elapsed: float
+    samples: List[SoakSample] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def summary(self) -> str:
+        lines = [f"{self.ticks:,} ticks, {self.games:,} games in {self.elapsed:.1f}s "
+                 f"({self.ticks / max(self.elapsed, 1e-9):,.0f} ticks/s)"]
+        if self.samples:
+            first, last = self.samples[0], self.samples[-1]
+            lines.append(f"traced memory {first.memory / 1024:.0f} KiB -> {last.memory / 1024:.0f} KiB, "
+                         f"tick time {first.tick_time * 1e6:.1f}us -> {last.tick_time * 1e6:.1f}us")
+        lines.extend(f"FAIL: {failure}" for failure in self.failures)
+        if not self.failures:
+            lines.append("OK")
+        return "\n".join(lines)
+
+
+def find_trends(samples: List[SoakSample], memory_tolerance: int = 256 * 1024, time_tolerance: float = 0.5,
+                warmup: float = 0.2) -> List[str]:
+    """
+    Compares the last third of the run with the first third, after a warm-up.
+    Medians keep a GC pause or a noisy neighbour from deciding the result.
+    """
+    usable = samples[int(len(samples) * warmup):]
+    third = len(usable) // 3
+    if third < 2:
+        return []
+    early, late = usable[:third], usable[-third:]
+
+    failures = []
+    growth = statistics.median(s.memory for s in late) - statistics.median(s.memory for s in early)
+    if growth > memory_tolerance:
+        failures.append(f"traced memory grew by {growth / 1024:.0f} KiB between ticks "
+                        f"{early[0].tick:,} and {late[-1].tick:,}")
+    before = statistics.median(s.tick_time for s in early)
+    after = statistics.median(s.tick_time for s in late)
+    if after > before * (1 + time_tolerance):
+        failures.append(f"tick time rose from {before * 1e6:.1f}us to {after * 1e6:.1f}us")
+    return failures
+
+
+class SoakHarness:
+    """
+    Drives a GameEngine headless for a long run, restarting after every game over.
+
+    Game rules are checked after every tick; tracemalloc and tick timing are
+    sampled every sample_interval ticks and judged with find_trends at the end.
+    """
+
+    def __init__(self, engine: GameEngine, commands: Commands, sample_interval: int = 10000,
+                 memory_tolerance: int = 256 * 1024, time_tolerance: float = 0.5):
+        self.engine = engine
+        self.commands = commands
+        self.sample_interval = sample_interval
+        self.memory_tolerance = memory_tolerance
+        self.time_tolerance = time_tolerance
+        self._rewards = {10}
+        if engine.powerups:
+            self._rewards.add(engine.powerups.bonus_points)
+
+    def _new_game(self):
+        snake = self.engine.snake
+        self._initial_length = len(snake.body)
+        self._pickups = 0
+        self._score = 0
+        self._head = (snake.head.x, snake.head.y)
+        self._moves_since_phase = None
+
+    def check_invariants(self):
+        engine = self.engine
+        state = engine.state
+        if state.status != GameStatus.PLAYING:
+            return
+        tick = engine.tick
+        body = [(p.x, p.y) for p in engine.snake.body]
+        cells = set(body)
+
+        if state.score != self._score:
+            if state.score - self._score not in self._rewards:
+                raise InvariantError(tick, f"score jumped from {self._score} to {state.score}")
+            self._pickups += 1
+            self._score = state.score
+        # A pickup grows the snake on its next move
+        expected = self._initial_length + self._pickups - engine.snake.growing
+        if len(body) != expected:
+            raise InvariantError(tick, f"body length {len(body)}, expected {expected} at score {state.score}")
+
+        # After a phase ends the snake may still lie across itself until the overlap moves out
+        if body[0] != self._head:
+            self._head = body[0]
+            if self._moves_since_phase is not None:
+                self._moves_since_phase += 1
+        if state.phase_active:
+            self._moves_since_phase = 0
+        if len(cells) != len(body):
+            if self._moves_since_phase is None or self._moves_since_phase > len(body):
+                raise InvariantError(tick, "snake occupies a cell twice without phase")
+
+        food = state.food_position
+        if food is not None and (food.x, food.y) in cells:
+            raise InvariantError(tick, f"food at {food} is on the snake")
+        width, height = engine.board.width, engine.board.height
+        if not all(0 <= x < width and 0 <= y < height for x, y in body):
+            raise InvariantError(tick, "snake left the board")
+
+    def run(self, ticks: int) -> SoakReport:
+        engine = self.engine
+        report = SoakReport(ticks=ticks, games=1, elapsed=0.0)
+        # Every game over logs a warning; keep a long run from filling the console (or a capturing handler)
+        pybite_logger = logging.getLogger("pybite")
+        previous_level = pybite_logger.level
+        pybite_logger.setLevel(logging.ERROR)
+        tracemalloc.start()
+        started = window_start = time.perf_counter()
+        try:
+            engine.reset()
+            self._new_game()
+            for i in range(1, ticks + 1):
+                if engine.state.status != GameStatus.PLAYING:
+                    engine.process_command({"restart": True})
+                    report.games += 1
+                    self._new_game()
+                command = next(self.commands)
+                if command:
+                    engine.process_command(command)
+                engine.step()
+                self.check_invariants()
+
+                if i % self.sample_interval == 0:
+                    now = time.perf_counter()
+                    memory, _ = tracemalloc.get_traced_memory()
+                    report.samples.append(SoakSample(engine.tick, memory, (now - window_start) / self.sample_interval))
+                    window_start = time.perf_counter()
+        finally:
+            tracemalloc.stop()
+            pybite_logger.setLevel(previous_level)
+        report.elapsed = time.perf_counter() - started
+        report.failures = find_trends(report.samples, self.memory_tolerance, self.time_tolerance)
+        return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Long-running headless engine soak with invariant checks")
+    parser.add_argument("--ticks", type=int, default=2_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--source", choices=("random", "gestures", "replay"), default="random")
+    parser.add_argument("--log", help="Command log to loop with --source replay")
+    parser.add_argument("--powerups", action="store_true")
+    parser.add_argument("--sample-interval", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.source == "replay":
+        if not args.log:
+            parser.error("--source replay needs --log")
+        command_log = CommandLog.load(args.log)
+        soak_engine = GameEngine(board_size=tuple(command_log.board_size), seed=command_log.seed,
+                                 powerups=command_log.powerups)
+        source = replayed_commands(command_log)
+    else:
+        soak_engine = GameEngine(seed=args.seed, powerups=args.powerups)
+        source = random_commands(rng) if args.source == "random" else gesture_commands(rng)
+
+    try:
+        result = SoakHarness(soak_engine, source, sample_interval=args.sample_interval).run(args.ticks)
+    except InvariantError as error:
+        print(f"FAIL: {error}")
+        sys.exit(1)
+    print(result.summary())
+    sys.exit(0 if result.ok else 1)
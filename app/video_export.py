@@ -0,0 +1,191 @@
+import os
+import sys
+import shutil
+import logging
+import tempfile
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional, Tuple
+
+# Off-screen rendering: no window, no display server needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import cv2
+import numpy as np
+
+from app.renderer import GameRenderer, PlayerSlot, GRID_SIZE, WINDOW_HEIGHT
+from core.quality_governor import QualityGovernor
+from core.telemetry import LOG_FORMAT
+from game.replay import CommandLog, Replayer
+
+logger = logging.getLogger("pybite.video_export")
+
+
+class ReplayRenderer(GameRenderer):
+    """
+    The game's drawing code pointed at an off-screen surface, driven by a Replayer.
+    There is no window, camera or vision; the sidebar shows the replay clock instead.
+    """
+
+    def __init__(self, replayer: Replayer):
+        if tuple(replayer.log.board_size) != GRID_SIZE:
+            raise ValueError(f"Can only render {GRID_SIZE} boards, log has {tuple(replayer.log.board_size)}")
+        pygame.init()
+        self.replayer = replayer
+        super().__init__(pygame.Surface(GameRenderer.window_size(1)), [PlayerSlot(replayer.engine)],
+                         QualityGovernor(adaptive=False))
+
+    def render(self) -> pygame.Surface:
+        """Draws the engine's current state, with the last recorded command as gesture feedback."""
+        self.players[0].debug_gestures = self.replayer.last_command
+        self._render_game(self.engine.state)
+        self.frame_index += 1
+        return self.screen
+
+    def frame_bgr(self) -> np.ndarray:
+        """The screen as an OpenCV frame: one read of the pixels, one colour conversion."""
+        width, height = self.screen.get_size()
+        rgb = np.frombuffer(pygame.image.tobytes(self.screen, "RGB"), dtype=np.uint8).reshape(height, width, 3)
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+
+    def _render_sidebar_panel(self, sidebar_x: int):
+        seconds = self.engine.game_time()
+        clock_txt = f"REPLAY {int(seconds // 60):02d}:{seconds % 60:05.2f}"
+        self.screen.blit(self.font.render(clock_txt, True, (255, 255, 255)), (sidebar_x, 20))
+        tick_txt = f"Tick {self.engine.tick}"
+        self.screen.blit(pygame.font.SysFont("Arial", 14).render(tick_txt, True, (150, 150, 150)), (sidebar_x, 55))
+        self._render_gesture_status(sidebar_x)
+
+
+def split_frames(frames: int, parts: int) -> List[Tuple[int, int]]:
+    """Splits frames 0..frames-1 into at most `parts` contiguous [start, end) ranges of near-equal size."""
+    parts = max(1, min(parts, frames))
+    bounds = [frames * k // parts for k in range(parts + 1)]
+    return [(bounds[k], bounds[k + 1]) for k in range(parts) if bounds[k] < bounds[k + 1]]
+
+
+def _frame_tick(log: CommandLog, first_tick: int, fps: int, frame: int) -> int:
+    return first_tick + round(frame * log.tick_rate / fps)
+
+
+def _render_segment(log: CommandLog, first_tick: int, fps: int, out_dir: str, png: bool,
+                    segment: Tuple[int, int]) -> str:
+    """
+    Worker: fast-forwards a private engine to the segment's first frame, then renders it.
+    Returns the segment's video file, or out_dir for PNG frames (named by global frame index).
+    """
+    start, end = segment
+    replayer = Replayer(log)
+    renderer = ReplayRenderer(replayer)
+    replayer.advance_to(_frame_tick(log, first_tick, fps, start))
+
+    writer = None
+    path = out_dir
+    if not png:
+        path = os.path.join(out_dir, f"segment_{start:08d}.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps,
+                                 (renderer.window_width, WINDOW_HEIGHT))
+    try:
+        for frame in range(start, end):
+            replayer.advance_to(_frame_tick(log, first_tick, fps, frame))
+            surface = renderer.render()
+            if writer is None:
+                pygame.image.save(surface, os.path.join(out_dir, f"frame_{frame:08d}.png"))
+            else:
+                writer.write(renderer.frame_bgr())
+    finally:
+        if writer is not None:
+            writer.release()
+    return path
+
+
+def _join_segments(parts: List[str], output: str, fps: int):
+    """Concatenates segment videos in order; stream copy through ffmpeg when available, else re-encode."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        listing = os.path.join(os.path.dirname(parts[0]), "segments.txt")
+        with open(listing, "w") as f:
+            f.writelines(f"file '{os.path.abspath(p)}'\n" for p in parts)
+        subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing, "-c", "copy", output], check=True)
+        return
+
+    writer = None
+    try:
+        for part in parts:
+            reader = cv2.VideoCapture(part)
+            while True:
+                ok, frame = reader.read()
+                if not ok:
+                    break
+                if writer is None:
+                    height, width = frame.shape[:2]
+                    writer = cv2.VideoWriter(output, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+                writer.write(frame)
+            reader.release()
+    finally:
+        if writer is not None:
+            writer.release()
+
+
+def export_replay(log: CommandLog, output: str, fps: int = 30, workers: Optional[int] = None,
+                  start: float = 0.0, end: Optional[float] = None, png: bool = False) -> int:
+    """
+    Renders a recorded session to a video file, or to a directory of PNG frames if png is set.
+
+    The timeline is cut into contiguous segments rendered by a pool of worker processes,
+    a few segments per worker so one slow segment does not leave the other cores idle.
+    Returns the number of frames written.
+    """
+    workers = workers or os.cpu_count() or 1
+    first_tick = max(0, int(start * log.tick_rate))
+    last_tick = log.final_tick if end is None else min(log.final_tick, int(end * log.tick_rate))
+    if last_tick < first_tick:
+        raise ValueError(f"Nothing to export between {start}s and {end}s")
+    frames = (last_tick - first_tick) * fps // log.tick_rate + 1
+    segments = split_frames(frames, workers * 4)
+
+    if png:
+        os.makedirs(output, exist_ok=True)
+        out_dir = output
+    else:
+        out_dir = tempfile.mkdtemp(prefix="pybite-export-", dir=os.path.dirname(os.path.abspath(output)))
+
+    logger.info("Rendering %d frames in %d segments on %d workers", frames, len(segments), workers)
+    try:
+        render = partial(_render_segment, log, first_tick, fps, out_dir, png)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(render, segments))
+        if not png:
+            _join_segments(parts, output, fps)
+    finally:
+        if not png:
+            shutil.rmtree(out_dir, ignore_errors=True)
+    return frames
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Render a recorded session to video, off-screen and in parallel")
+    parser.add_argument("log", help="Command log written by --record")
+    parser.add_argument("output", help="Video file (.mp4), or a directory with --png")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument("--start", type=float, default=0.0, help="Start of the clip, in seconds of game time")
+    parser.add_argument("--end", type=float, default=None, help="End of the clip, in seconds of game time")
+    parser.add_argument("--png", action="store_true", help="Write a PNG sequence instead of a video")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    began = time.perf_counter()
+    count = export_replay(CommandLog.load(args.log), args.output, fps=args.fps, workers=args.workers,
+                          start=args.start, end=args.end, png=args.png)
+    elapsed = time.perf_counter() - began
+    print(f"Exported {count} frames in {elapsed:.1f}s ({count / max(elapsed, 1e-9):.0f} frames/s) -> {args.output}")
@@ -18,6 +18,11 @@ class GameStatus(Enum):
     PAUSED = auto()
     GAME_OVER = auto()
 
+class ItemKind(Enum):
+    BONUS_FOOD = auto()   # Extra food worth more points; disappears if not eaten in time
+    SPEED_TILE = auto()   # Temporarily speeds the snake up
+    TEMP_WALL = auto()    # Blocks the cell until it expires; deadly unless phased
+
 @dataclass
 class Point:
     x: int
@@ -30,6 +35,13 @@ class Point:
         yield self.x
         yield self.y
 
+@dataclass
+class BoardItem:
+    """A timed pickup or obstacle placed on the board."""
+    kind: ItemKind
+    position: Point
+    expires_at: float  # Game time (seconds) when the item disappears
+
 @dataclass
 class GameState:
     """Represents the complete state of the game at any given time."""
@@ -53,6 +65,10 @@ class GameState:
     food_position: Optional[Point] = None
     board_size: Tuple[int, int] = (20, 20)
     
+    # Power-ups (only used when the engine runs with power-ups enabled)
+    board_items: List[BoardItem] = field(default_factory=list)
+    speed_tile_active: bool = False
+    
     def reset(self):
         self.status = GameStatus.PLAYING
         self.score = 0
@@ -64,3 +80,5 @@ class GameState:
         self.phase_cooldown = 0.0
         self.boost_active = False
         self.boost_meter = 100.0
+        self.board_items = []
+        self.speed_tile_active = False
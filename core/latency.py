@@ -0,0 +1,52 @@
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# Pipeline checkpoints in order. "onset" is only known for synthetic or labelled input.
+CHECKPOINTS = ("onset", "captured", "tracked", "interpreted", "commanded", "moved", "flipped")
+
+class LatencyTracker:
+    """
+    Collects input-to-screen latency samples.
+
+    Each sample is a dict of checkpoint -> timestamp (seconds, same clock) for one
+    direction change. Consecutive checkpoints give per-stage latencies; the first
+    and last give the end-to-end figure.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.samples: Dict[str, Deque[float]] = {}
+        self.max_samples = max_samples
+
+    def _add(self, name: str, seconds: float):
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=self.max_samples)
+        self.samples[name].append(seconds)
+
+    def record(self, timestamps: Dict[str, float]):
+        present = [name for name in CHECKPOINTS if timestamps.get(name) is not None]
+        if len(present) < 2:
+            return
+        for start, end in zip(present, present[1:]):
+            self._add(f"{start}->{end}", timestamps[end] - timestamps[start])
+        self._add("end_to_end", timestamps[present[-1]] - timestamps[present[0]])
+
+    def percentiles(self, name: str) -> Optional[Dict[str, float]]:
+        """p50/p95/p99/max in milliseconds for one stage, or None without samples."""
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return None
+
+        def pick(q: float) -> float:
+            return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+        return {"count": len(values), "p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": values[-1] * 1000}
+
+    def report(self) -> str:
+        lines: List[str] = []
+        for name in self.samples:
+            stats = self.percentiles(name)
+            lines.append(
+                f"{name:<24} n={stats['count']:<6} p50 {stats['p50']:7.1f}ms  p95 {stats['p95']:7.1f}ms  "
+                f"p99 {stats['p99']:7.1f}ms  max {stats['max']:7.1f}ms"
+            )
+        return "\n".join(lines) if lines else "No latency samples recorded"
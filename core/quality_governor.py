@@ -0,0 +1,118 @@
+import time
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("pybite.quality")
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """One rung of the quality ladder; every knob the governor may turn."""
+    name: str
+    model_complexity: int            # MediaPipe Hands model (1 = full, 0 = lite)
+    inference_scale: float           # Fraction of the captured frame fed to MediaPipe
+    inference_interval: int          # Run tracking every Nth frame, extrapolate in between
+    capture_size: Tuple[int, int]    # Camera resolution requested from the driver
+    capture_fps: int
+    preview_interval: int            # Refresh the sidebar camera preview every Nth frame
+    effects: bool                    # Translucent overlays such as the phase flash
+
+# Highest quality first
+QUALITY_LADDER: List[QualityLevel] = [
+    QualityLevel("HIGH", 1, 1.0, 1, (640, 480), 30, 1, True),
+    QualityLevel("MEDIUM", 1, 0.75, 1, (640, 480), 30, 2, True),
+    QualityLevel("LOW", 0, 0.75, 2, (480, 360), 30, 3, False),
+    QualityLevel("MINIMUM", 0, 1.0, 3, (320, 240), 15, 6, False),
+]
+
+class QualityGovernor:
+    """
+    Keeps the frame loop inside its time budget by walking the quality ladder.
+
+    Per-stage timings are smoothed with an exponential moving average. A sustained
+    overrun steps one level down; sustained headroom steps one level back up.
+    Upgrading needs a longer streak than downgrading so the level doesn't oscillate.
+    """
+
+    def __init__(self, target_frame_time: float = 1 / 30, ladder: List[QualityLevel] = QUALITY_LADDER,
+                 start_level: int = 0, downgrade_after: int = 15, upgrade_after: int = 90,
+                 headroom: float = 0.7, smoothing: float = 0.1, adaptive: bool = True,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.target_frame_time = target_frame_time
+        self.ladder = ladder
+        self.level_index = start_level
+        self.downgrade_after = downgrade_after
+        self.upgrade_after = upgrade_after
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.adaptive = adaptive  # When False, timings are still measured but the level never moves
+        self.clock = clock
+
+        self.frame_time = 0.0  # Smoothed, seconds
+        self.last_frame_time = 0.0  # Raw, seconds
+        self.stage_times: Dict[str, float] = {}  # Smoothed, seconds
+        self._frame_start: Optional[float] = None
+        self._over_streak = 0
+        self._under_streak = 0
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.ladder[self.level_index]
+
+    def _smooth(self, previous: float, sample: float) -> float:
+        if previous == 0.0:
+            return sample
+        return previous + self.smoothing * (sample - previous)
+
+    def begin_frame(self):
+        self._frame_start = self.clock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Times one stage of the frame (e.g. vision, engine, render)."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            self.stage_times[name] = self._smooth(self.stage_times.get(name, 0.0), elapsed)
+
+    def end_frame(self) -> bool:
+        """Closes the frame and returns True if the quality level changed."""
+        if self._frame_start is None:
+            return False
+        self.last_frame_time = self.clock() - self._frame_start
+        self.frame_time = self._smooth(self.frame_time, self.last_frame_time)
+        self._frame_start = None
+        if not self.adaptive:
+            return False
+
+        if self.frame_time > self.target_frame_time:
+            self._over_streak += 1
+            self._under_streak = 0
+        elif self.frame_time < self.target_frame_time * self.headroom:
+            self._under_streak += 1
+            self._over_streak = 0
+        else:
+            self._over_streak = self._under_streak = 0
+
+        if self._over_streak >= self.downgrade_after and self.level_index < len(self.ladder) - 1:
+            return self._change_level(self.level_index + 1)
+        if self._under_streak >= self.upgrade_after and self.level_index > 0:
+            return self._change_level(self.level_index - 1)
+        return False
+
+    def _change_level(self, index: int) -> bool:
+        previous, timings = self.level.name, self.describe()
+        self.level_index = index
+        self._over_streak = self._under_streak = 0
+        # Judge the new level on its own frames, not the average that triggered the change
+        self.frame_time = 0.0
+        logger.info("Quality %s -> %s (%s)", previous, self.level.name, timings)
+        return True
+
+    def describe(self) -> str:
+        """Short timing summary for logs and the HUD."""
+        stages = " ".join(f"{name} {t * 1000:.1f}" for name, t in self.stage_times.items())
+        return f"frame {self.frame_time * 1000:.1f}ms / {self.target_frame_time * 1000:.1f}ms; {stages}"
@@ -0,0 +1,268 @@
+import time
+import queue
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass, astuple, fields
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("pybite.scores")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    ended_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    player INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    direction_changes INTEGER NOT NULL,
+    pinches INTEGER NOT NULL,
+    fists INTEGER NOT NULL,
+    frames INTEGER NOT NULL,
+    frame_time_mean REAL NOT NULL,
+    frame_time_p95 REAL NOT NULL,
+    frame_time_max REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_score ON sessions (score DESC, ended_at);
+CREATE INDEX IF NOT EXISTS sessions_by_day_score ON sessions (day, score DESC);
+
+-- One row per day, kept up to date in the same transaction as the inserts,
+-- so per-day reports never scan the sessions table
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    best_score INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    total_frame_time_mean REAL NOT NULL
+);
+"""
+
+_UPSERT_DAY = """
+INSERT INTO daily_stats (day, sessions, total_score, best_score, total_duration, total_frame_time_mean)
+VALUES (?, 1, ?, ?, ?, ?)
+ON CONFLICT(day) DO UPDATE SET
+    sessions = sessions + 1,
+    total_score = total_score + excluded.total_score,
+    best_score = MAX(best_score, excluded.best_score),
+    total_duration = total_duration + excluded.total_duration,
+    total_frame_time_mean = total_frame_time_mean + excluded.total_frame_time_mean
+"""
+
+# Queue markers for the writer thread
+_FLUSH = object()
+_STOP = object()
+
+
+@dataclass
+class SessionRecord:
+    """One finished game: from start to game over (or app exit)."""
+    started_at: float  # Unix time
+    ended_at: float
+    day: str  # Local date, YYYY-MM-DD
+    player: int
+    score: int
+    duration: float  # Seconds
+    direction_changes: int = 0
+    pinches: int = 0
+    fists: int = 0
+    frames: int = 0
+    frame_time_mean: float = 0.0  # Seconds
+    frame_time_p95: float = 0.0
+    frame_time_max: float = 0.0
+
+
+class SessionStats:
+    """Collects one player's gesture and frame-time numbers for the game in progress."""
+
+    def __init__(self, player: int = 0, clock: Callable[[], float] = time.time):
+        self.player = player
+        self.clock = clock
+        self.started_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self):
+        self.direction_changes = 0
+        self.pinches = 0
+        self.fists = 0
+        self.frame_times: List[float] = []
+        self._last_direction = None
+        self._pinching = False
+        self._fist = False
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None
+
+    def start(self):
+        self._reset()
+        self.started_at = self.clock()
+
+    def on_commands(self, commands: Dict[str, Any]):
+        """Counts gesture onsets (a held pinch or fist counts once)."""
+        direction = commands.get("direction")
+        if direction and direction != self._last_direction:
+            self.direction_changes += 1
+            self._last_direction = direction
+        phase, boost = bool(commands.get("phase")), bool(commands.get("boost"))
+        self.pinches += phase and not self._pinching
+        self.fists += boost and not self._fist
+        self._pinching, self._fist = phase, boost
+
+    def on_frame(self, frame_time: float):
+        self.frame_times.append(frame_time)
+
+    def finish(self, score: int) -> SessionRecord:
+        ended_at = self.clock()
+        times = sorted(self.frame_times)
+        record = SessionRecord(
+            started_at=self.started_at,
+            ended_at=ended_at,
+            day=time.strftime("%Y-%m-%d", time.localtime(self.started_at)),
+            player=self.player,
+            score=score,
+            duration=ended_at - self.started_at,
+            direction_changes=self.direction_changes,
+            pinches=self.pinches,
+            fists=self.fists,
+            frames=len(times),
+            frame_time_mean=sum(times) / len(times) if times else 0.0,
+            frame_time_p95=times[min(len(times) - 1, int(0.95 * len(times)))] if times else 0.0,
+            frame_time_max=times[-1] if times else 0.0,
+        )
+        self.started_at = None
+        return record
+
+
+class ScoreStore:
+    """
+    Local SQLite store for high scores and session analytics.
+
+    record() only puts the session on a queue. A background thread batches
+    inserts and commits when flush() is called (e.g. at game over), when
+    batch_size sessions are waiting, or flush_interval seconds after the
+    oldest unwritten one. The database runs in WAL mode so reads from the
+    game thread do not wait for the writer.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 5.0, batch_size: int = 256):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue()
+
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._run, name="pybite-score-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # Durable at checkpoints; a crash loses at most the last commits
+        return conn
+
+    # --- Writes (any thread, never block) ---
+
+    def record(self, session: SessionRecord):
+        self._queue.put(session)
+
+    def flush(self):
+        """Asks the writer to commit what it has now. Does not wait for it."""
+        self._queue.put(_FLUSH)
+
+    def close(self):
+        """Writes everything still queued, then stops the writer."""
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._reader.close()
+
+    def _run(self):
+        conn = self._connect()
+        pending: List[SessionRecord] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FLUSH
+
+            if item is _STOP or item is _FLUSH:
+                self._write(conn, pending)
+                pending = []
+                if item is _STOP:
+                    break
+                continue
+
+            if not pending:
+                deadline = time.monotonic() + self.flush_interval
+            pending.append(item)
+            if len(pending) >= self.batch_size:
+                self._write(conn, pending)
+                pending = []
+        conn.close()
+
+    def _write(self, conn: sqlite3.Connection, sessions: List[SessionRecord]):
+        if not sessions:
+            return
+        columns = ", ".join(f.name for f in fields(SessionRecord))
+        placeholders = ", ".join("?" for _ in fields(SessionRecord))
+        try:
+            with conn:
+                conn.executemany(f"INSERT INTO sessions ({columns}) VALUES ({placeholders})",
+                                 [astuple(s) for s in sessions])
+                conn.executemany(_UPSERT_DAY, [(s.day, s.score, s.score, s.duration, s.frame_time_mean)
+                                               for s in sessions])
+            logger.debug("Wrote %d sessions", len(sessions))
+        except sqlite3.Error:
+            logger.exception("Failed to write %d sessions to %s", len(sessions), self.path)
+
+    # --- Reads (the thread that created the store) ---
+
+    def high_score(self) -> int:
+        row = self._reader.execute("SELECT MAX(score) FROM sessions").fetchone()
+        return row[0] or 0
+
+    def leaderboard(self, limit: int = 10, day: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Best sessions overall, or on one day; served straight from the score indexes."""
+        if day is None:
+            cursor = self._reader.execute(
+                "SELECT day, player, score, duration FROM sessions ORDER BY score DESC, ended_at LIMIT ?", (limit,))
+        else:
+            cursor = self._reader.execute(
+                "SELECT day, player, score, duration FROM sessions WHERE day = ? ORDER BY score DESC LIMIT ?",
+                (day, limit))
+        return [dict(zip(("day", "player", "score", "duration"), row)) for row in cursor]
+
+    def daily(self, since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per-day session count, mean and best score, play time and mean frame time, oldest first."""
+        cursor = self._reader.execute(
+            "SELECT day, sessions, total_score, best_score, total_duration, total_frame_time_mean "
+            "FROM daily_stats WHERE day >= ? AND day <= ? ORDER BY day",
+            (since or "", until or "9999-99-99"))
+        return [
+            {"day": day, "sessions": n, "mean_score": total / n, "best_score": best,
+             "play_time": play_time, "frame_time_mean": frame_time / n}
+            for day, n, total, best, play_time, frame_time in cursor
+        ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        print("Usage: python -m core.score_store <scores.db>")
+        sys.exit(2)
+
+    store = ScoreStore(sys.argv[1])
+    print(f"High score: {store.high_score()}")
+    for rank, entry in enumerate(store.leaderboard(), start=1):
+        print(f"{rank:>3}. {entry['score']:>6}  P{entry['player'] + 1}  {entry['day']}  {entry['duration']:.0f}s")
+    for entry in store.daily():
+        print(f"{entry['day']}  {entry['sessions']:>5} games  mean {entry['mean_score']:7.1f}  "
+              f"best {entry['best_score']:>6}  {entry['play_time'] / 60:6.1f} min  "
+              f"{entry['frame_time_mean'] * 1000:5.1f}ms/frame")
+    store.close()
@@ -1,10 +1,15 @@
+from typing import Optional
 from core.event_types import GameStatus, GameState
+from core.score_store import ScoreStore
 
 class StateManager:
     """Manages high-level game states and state transitions."""
     
-    def __init__(self):
+    def __init__(self, score_store: Optional[ScoreStore] = None):
         self.state = GameState()
+        # The high score outlives the process when a store is attached; sessions are written by the app
+        if score_store is not None:
+            self.state.high_score = score_store.high_score()
         
     def start_game(self):
         """Transition from MENU or GAME_OVER to PLAYING."""
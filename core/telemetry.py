@@ -0,0 +1,168 @@
+import json
+import queue
+import sys
+import time
+import logging
+from collections import Counter, deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+logger = logging.getLogger("pybite.telemetry")
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Hands records to a background listener without ever blocking the caller.
+
+    When the queue is full, INFO and below are dropped. A WARNING or above
+    evicts the oldest queued record instead so it still gets through.
+    Records are not formatted here; the listener thread does that.
+    """
+
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.WARNING:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+        telemetry.count("log_records_dropped")
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most `burst` records per message template through every `interval` seconds.
+    The next record that gets through carries the number suppressed in between.
+    Warnings and errors are never limited.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.clock = clock
+        self._windows: Dict[Tuple[str, Any], list] = {}  # key -> [window start, passed, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.msg)
+        now = self.clock()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            if window and window[2]:
+                record.suppressed = window[2]
+            if len(self._windows) > 1024:
+                self._windows.clear()  # Un-templated (pre-formatted) messages must not grow this forever
+            self._windows[key] = [now, 1, 0]
+            return True
+        if window[1] < self.burst:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+class _SuppressionFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{text} [{suppressed} similar suppressed]" if suppressed else text
+
+
+def setup_logging(level: int = logging.INFO, queue_size: int = 1000, burst: int = 5,
+                  interval: float = 1.0) -> QueueListener:
+    """
+    Routes all pybite logging through a bounded queue to a background thread.
+    Call .stop() on the returned listener at shutdown to flush what is queued.
+    """
+    record_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    handler = DroppingQueueHandler(record_queue)
+    handler.addFilter(RateLimitFilter(burst=burst, interval=interval))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(_SuppressionFormatter(LOG_FORMAT))
+    listener = QueueListener(record_queue, output, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+class _JsonPayload:
+    """Defers json.dumps until the listener thread formats the record."""
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return json.dumps(self.payload, separators=(",", ":"))
+
+
+class Telemetry:
+    """
+    Structured counters for the hot path.
+
+    count() is a dictionary increment. sample() is called once per frame and
+    closes a window every `window` seconds into a ring buffer of recent
+    windows, which dump() hands to the logging thread on demand.
+    """
+
+    def __init__(self, window: float = 1.0, history: int = 300):
+        self.window = window
+        self.current: Counter = Counter()
+        self.totals: Counter = Counter()
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._window_start: Optional[float] = None
+
+    def count(self, name: str, n: int = 1):
+        self.current[name] += n
+
+    def sample(self, now: float):
+        if self._window_start is None:
+            self._window_start = now
+            return
+        duration = now - self._window_start
+        if duration < self.window:
+            return
+        self.history.append({"start": self._window_start, "duration": duration, **self.current})
+        self.totals.update(self.current)
+        self.current = Counter()
+        self._window_start = now
+
+    def rates(self) -> Dict[str, float]:
+        """Per-second rates over the most recent closed window."""
+        if not self.history:
+            return {}
+        last = self.history[-1]
+        return {k: v / last["duration"] for k, v in last.items() if k not in ("start", "duration")}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"totals": dict(self.totals + self.current), "windows": list(self.history)}
+
+    def dump(self):
+        """Logs the ring buffer as one JSON record; serialisation happens off the frame thread."""
+        logger.info("telemetry %s", _JsonPayload(self.snapshot()))
+
+
+# Process-wide counters, shared like the module-level loggers
+telemetry = Telemetry()
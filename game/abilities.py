@@ -1,65 +1,86 @@
-import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
+from game.timer_wheel import TimerWheel, Timer
 
 @dataclass
 class Ability:
     name: str
     cooldown_seconds: float
     duration_seconds: float
-    last_activation_time: float = 0.0
-    active_until: float = 0.0
-    
+    # Expiry and cooldown are events on the engine's timer wheel, not clock polls
+    timers: TimerWheel = field(repr=False)
+    active: bool = False
+    ready: bool = True
+    ready_at: float = 0.0  # Game time (seconds) when the cooldown ends
+    _expiry: Optional[Timer] = field(default=None, repr=False)
+
     @property
     def is_active(self) -> bool:
-        return time.time() < self.active_until
-        
+        return self.active
+
     @property
     def is_ready(self) -> bool:
-        return time.time() > (self.last_activation_time + self.cooldown_seconds)
-        
+        return self.ready
+
     @property
     def cooldown_remaining(self) -> float:
-        remaining = (self.last_activation_time + self.cooldown_seconds) - time.time()
-        return max(0.0, remaining)
-        
+        return max(0.0, self.ready_at - self.timers.time)
+
     def activate(self) -> bool:
-        if self.is_ready:
-            now = time.time()
-            self.last_activation_time = now
-            self.active_until = now + self.duration_seconds
+        if self.ready:
+            self._activate_for(self.duration_seconds)
+            if self.cooldown_seconds > 0:
+                self.ready = False
+                self.ready_at = self.timers.time + self.cooldown_seconds
+                self.timers.schedule_after(self.cooldown_seconds, self._on_ready)
             return True
         return False
 
+    def _activate_for(self, seconds: float):
+        """(Re)starts the active window, replacing any pending expiry."""
+        self.timers.cancel(self._expiry)
+        self.active = True
+        self._expiry = self.timers.schedule_after(seconds, self._on_expired)
+
+    def _on_expired(self):
+        self.active = False
+        self._expiry = None
+
+    def _on_ready(self):
+        self.ready = True
+
 class PhaseAbility(Ability):
-    def __init__(self):
+    def __init__(self, timers: TimerWheel):
         super().__init__(
             name="Phase",
             cooldown_seconds=10.0,
-            duration_seconds=3.0
+            duration_seconds=3.0,
+            timers=timers
         )
 
 class BoostAbility(Ability):
     """
-    Boost behaves slightly differently: 
+    Boost behaves slightly differently:
     It consumes energy ('fist' gesture) rather than a fixed cooldown.
     """
-    def __init__(self):
+    def __init__(self, timers: TimerWheel):
         super().__init__(
             name="Boost",
             cooldown_seconds=0.0,
-            duration_seconds=0.5 # Active for a short burst per call
+            duration_seconds=0.5, # Active for a short burst per call
+            timers=timers
         )
         self.energy = 100.0
         self.consumption_rate = 20.0 # per second
         self.recharge_rate = 5.0 # per second
-        
+
     def update(self, dt: float, currently_boosting: bool):
         if currently_boosting and self.energy > 0:
             self.energy = max(0.0, self.energy - self.consumption_rate * dt)
-            self.active_until = time.time() + 0.1 # Keep active while held
+            self._activate_for(0.1) # Keep active while held
         else:
             self.energy = min(100.0, self.energy + self.recharge_rate * dt)
-            
+
     @property
     def is_active(self) -> bool:
         return super().is_active and self.energy > 0
@@ -0,0 +1,313 @@
+import heapq
+import logging
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+from core.event_types import GameState, GameStatus, ItemKind
+
+logger = logging.getLogger("pybite.autopilot")
+
+INF = 1 << 30
+
+# Neighbour order used everywhere below
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+
+class DistanceField:
+    """
+    BFS distances to a target cell on the wrapping grid.
+
+    Blocking or freeing a cell repairs only the affected region. Changing the
+    target needs a full BFS, which is time-sliced via advance() so no single
+    tick pays for the whole board.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        n = width * height
+        self.dist = [INF] * n
+        self.blocked = bytearray(n)
+        self.neighbors = [
+            ((i - width) % n, (i + width) % n,
+             (i // width) * width + (i % width - 1) % width,
+             (i // width) * width + (i % width + 1) % width)
+            for i in range(n)
+        ]
+        self.target: Optional[int] = None
+        self._frontier: Optional[deque] = None
+        self._deferred: List[Tuple[bool, int]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.target is not None and self._frontier is None
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def set_target(self, target: Optional[int]):
+        """Starts a fresh BFS from target; call advance() until it reports completion."""
+        self.target = target
+        self.dist = [INF] * len(self.dist)
+        self._deferred = []
+        if target is None:
+            self._frontier = None
+            return
+        self.dist[target] = 0
+        self._frontier = deque([target])
+
+    def advance(self, budget: int) -> bool:
+        """Expands up to budget cells of a pending rebuild. Returns True once the field is complete."""
+        frontier = self._frontier
+        if frontier is None:
+            return True
+        dist, blocked, neighbors = self.dist, self.blocked, self.neighbors
+        while frontier and budget > 0:
+            u = frontier.popleft()
+            d = dist[u] + 1
+            for v in neighbors[u]:
+                if d < dist[v] and not blocked[v]:
+                    dist[v] = d
+                    frontier.append(v)
+            budget -= 1
+        if frontier:
+            return False
+
+        # The BFS ran against a snapshot of the obstacles; replay what changed meanwhile
+        self._frontier = None
+        deferred, self._deferred = self._deferred, []
+        for is_block, i in deferred:
+            if is_block:
+                self.block(i)
+            else:
+                self.free(i)
+        return True
+
+    def block(self, i: int):
+        if self._frontier is not None:
+            self._deferred.append((True, i))
+            return
+        if self.blocked[i]:
+            return
+        dist, neighbors = self.dist, self.neighbors
+        old = dist[i]
+        self.blocked[i] = 1
+        dist[i] = INF
+        if old >= INF:
+            return
+
+        # Invalidate cells whose every shortest path ran through i, nearest first
+        heap = [(old + 1, v) for v in neighbors[i] if dist[v] == old + 1]
+        heapq.heapify(heap)
+        invalid = []
+        while heap:
+            d, u = heapq.heappop(heap)
+            if dist[u] != d:
+                continue
+            if any(dist[v] == d - 1 for v in neighbors[u]):
+                continue
+            dist[u] = INF
+            invalid.append(u)
+            for v in neighbors[u]:
+                if dist[v] == d + 1:
+                    heapq.heappush(heap, (d + 1, v))
+
+        # Re-seed the invalidated region from its boundary and relax
+        heap = []
+        for u in invalid:
+            best = min(dist[v] for v in neighbors[u])
+            if best < INF:
+                dist[u] = best + 1
+                heap.append((best + 1, u))
+        heapq.heapify(heap)
+        self._relax(heap)
+
+    def free(self, i: int):
+        if self._frontier is not None:
+            self._deferred.append((False, i))
+            return
+        if not self.blocked[i]:
+            return
+        self.blocked[i] = 0
+        best = 0 if i == self.target else min(self.dist[v] for v in self.neighbors[i]) + 1
+        if best < INF:
+            self.dist[i] = best
+            self._relax([(best, i)])
+
+    def _relax(self, heap: List[Tuple[int, int]]):
+        dist, blocked, neighbors = self.dist, self.blocked, self.neighbors
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d != dist[u]:
+                continue
+            for v in neighbors[u]:
+                if not blocked[v] and dist[v] > d + 1:
+                    dist[v] = d + 1
+                    heapq.heappush(heap, (d + 1, v))
+
+
+class Autopilot:
+    """
+    Built-in controller for attract mode and load generation.
+    Produces the same command dictionary as GestureInterpreter.get_command.
+    """
+
+    def __init__(self, rebuild_budget: int = 8000):
+        # Cells expanded per decision while a new food target's field is being built
+        self.rebuild_budget = rebuild_budget
+        self.field: Optional[DistanceField] = None
+        self._occupancy: List[int] = []
+        self._food: Optional[Tuple[int, int]] = None
+        self._head: Optional[Tuple[int, int]] = None
+        self._tail: Optional[Tuple[int, int]] = None
+        self._length = 0
+        self._walls = set()
+
+    def get_command(self, state: GameState) -> Dict[str, Any]:
+        command = {"direction": None, "phase": False, "boost": False}
+        if state.status != GameStatus.PLAYING:
+            command["restart"] = True
+            return command
+
+        self._sync(state)
+        command["direction"] = self._choose_direction(len(state.snake_body))
+        return command
+
+    def _sync(self, state: GameState):
+        """Brings the cached field in line with the snake and food, incrementally where possible."""
+        w, h = state.board_size
+        body = state.snake_body
+        head = (body[0].x, body[0].y)
+        tail = (body[-1].x, body[-1].y)
+        food = tuple(state.food_position) if state.food_position else None
+        if food is not None and not (0 <= food[0] < w and 0 <= food[1] < h):
+            food = None
+        walls = {(i.position.x, i.position.y) for i in state.board_items if i.kind == ItemKind.TEMP_WALL}
+
+        field = self.field
+        if field is None or (field.width, field.height) != (w, h):
+            field = self.field = DistanceField(w, h)
+            self._rebuild(body, food, walls)
+        elif food != self._food:
+            self._rebuild(body, food, walls)
+        else:
+            if head != self._head or len(body) != self._length:
+                prev_head = (body[1].x, body[1].y) if len(body) > 1 else None
+                grew = len(body) == self._length + 1
+                if prev_head == self._head and (grew or len(body) == self._length):
+                    self._occupy(field.index(*head))
+                    if not grew:
+                        self._vacate(field.index(*self._tail))
+                else:
+                    self._rebuild(body, food, walls)
+                    
+            # Temporary walls come and go independently of the snake
+            for cell in walls - self._walls:
+                self._occupy(field.index(*cell))
+            for cell in self._walls - walls:
+                self._vacate(field.index(*cell))
+            self._walls = walls
+
+        self._head, self._tail, self._length = head, tail, len(body)
+        field.advance(self.rebuild_budget)
+
+    def _rebuild(self, body, food: Optional[Tuple[int, int]], walls: set):
+        field = self.field
+        # Obstacles must be in place before the BFS starts; it snapshots them
+        self._occupancy = [0] * len(field.dist)
+        field.blocked = bytearray(len(field.dist))
+        cells = [(p.x, p.y) for p in body] + list(walls)
+        for cell in cells:
+            i = field.index(*cell)
+            self._occupancy[i] += 1
+            field.blocked[i] = 1
+        field.set_target(field.index(*food) if food else None)
+        self._food = food
+        self._walls = walls
+
+    def _occupy(self, i: int):
+        self._occupancy[i] += 1
+        if self._occupancy[i] == 1:
+            self.field.block(i)
+
+    def _vacate(self, i: int):
+        self._occupancy[i] -= 1
+        if self._occupancy[i] == 0:
+            self.field.free(i)
+
+    def _choose_direction(self, length: int) -> Optional[str]:
+        field = self.field
+        head = field.index(*self._head)
+        candidates = [
+            (direction, cell)
+            for direction, cell in zip(DIRECTIONS, field.neighbors[head])
+            if not self._occupancy[cell]
+        ]
+        if not candidates:
+            return None
+
+        if field.ready:
+            ranked = sorted(candidates, key=lambda c: field.dist[c[1]])
+        else:
+            # Field still being rebuilt: fall back to wrapped Manhattan distance
+            ranked = sorted(candidates, key=lambda c: self._wrapped_distance(c[1]))
+
+        # Take the best move toward food that leaves room for the whole body
+        best_space, fallback = -1, candidates[0][0]
+        for direction, cell in ranked:
+            space = self._reachable_space(cell, length)
+            if space >= length:
+                return direction
+            if space > best_space:
+                best_space, fallback = space, direction
+        return fallback
+
+    def _wrapped_distance(self, cell: int) -> int:
+        if self._food is None:
+            return 0
+        w, h = self.field.width, self.field.height
+        dx = abs(cell % w - self._food[0])
+        dy = abs(cell // w - self._food[1])
+        return min(dx, w - dx) + min(dy, h - dy)
+
+    def _reachable_space(self, start: int, limit: int) -> int:
+        """Flood fill from start, stopping once limit free cells have been found."""
+        occupancy, neighbors = self._occupancy, self.field.neighbors
+        seen = {start}
+        queue = deque([start])
+        while queue and len(seen) < limit:
+            u = queue.popleft()
+            for v in neighbors[u]:
+                if v not in seen and not occupancy[v]:
+                    seen.add(v)
+                    queue.append(v)
+        return len(seen)
+
+
+if __name__ == "__main__":
+    import time
+    import argparse
+
+    from game.engine import GameEngine
+
+    parser = argparse.ArgumentParser(description="Run the autopilot headless as a load generator")
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = GameEngine(board_size=(args.size, args.size), seed=args.seed)
+    pilot = Autopilot()
+    engine.reset()
+
+    worst = 0.0
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        t0 = time.perf_counter()
+        engine.process_command(pilot.get_command(engine.state))
+        worst = max(worst, time.perf_counter() - t0)
+        engine.step()
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.ticks} ticks on {args.size}x{args.size} in {elapsed:.2f}s "
+          f"({args.ticks / elapsed:,.0f} ticks/s, worst decision {worst * 1000:.2f} ms), "
+          f"score {engine.state.score}, high score {engine.state.high_score}")
@@ -5,28 +5,35 @@ from core.event_types import Point
 class Board:
     """Handles the grid-based board logic and object placement."""
     
-    def __init__(self, size: Tuple[int, int] = (20, 20)):
+    def __init__(self, size: Tuple[int, int] = (20, 20), rng: Optional[random.Random] = None):
         self.width, self.height = size
+        # A dedicated RNG keeps food placement reproducible from a seed
+        self.rng = rng or random.Random()
+        self.max_probes = 16
         
     def get_random_empty_position(self, occupied_positions: List[Point]) -> Point:
         """Finds a random position on the grid not occupied by the snake."""
-        all_positions = [
-            Point(x, y) 
-            for x in range(self.width) 
-            for y in range(self.height)
-        ]
+        occupied = {(p.x, p.y) for p in occupied_positions}
+        
+        # On large, mostly empty boards a few random probes almost always hit a free
+        # cell, which avoids materialising the whole grid.
+        if len(occupied) * 2 < self.width * self.height:
+            for _ in range(self.max_probes):
+                x, y = self.rng.randrange(self.width), self.rng.randrange(self.height)
+                if (x, y) not in occupied:
+                    return Point(x, y)
         
-        # Convert occupied to a set of tuples for faster lookup if needed, 
-        # but for small grids a list is fine.
         empty_positions = [
-            p for p in all_positions 
-            if p not in occupied_positions
+            Point(x, y)
+            for x in range(self.width)
+            for y in range(self.height)
+            if (x, y) not in occupied
         ]
         
         if not empty_positions:
             return Point(-1, -1)  # Should not happen in normal gameplay
             
-        return random.choice(empty_positions)
+        return self.rng.choice(empty_positions)
         
     def is_within_bounds(self, point: Point) -> bool:
         """Checks if a point is within the board limits."""
@@ -1,11 +1,17 @@
 import time
+import random
+import hashlib
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from core.event_types import GameState, GameStatus, GameCommand, Point
 from core.state_manager import StateManager
+from core.score_store import ScoreStore
+from core.telemetry import telemetry
 from game.board import Board
 from game.snake import Snake
 from game.abilities import PhaseAbility, BoostAbility
+from game.timer_wheel import TimerWheel
+from game.powerups import PowerUpManager
 
 
 # Set up logger
@@ -14,40 +20,84 @@ logger = logging.getLogger("pybite.engine")
 class GameEngine:
     """Orchestrates game logic updates based on commands."""
     
-    def __init__(self, board_size: tuple = (20, 20)):
-        self.state_manager = StateManager()
-        self.board = Board(size=board_size)
+    def __init__(self, board_size: tuple = (20, 20), seed: Optional[int] = None, tick_rate: int = 60,
+                 powerups: bool = False, score_store: Optional[ScoreStore] = None):
+        # Seeded RNG so a session can be reproduced from its command log
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        
+        self.state_manager = StateManager(score_store)
+        self.board = Board(size=board_size, rng=self.rng)
         
         # Initialize GameState with board size
         self.state = self.state_manager.get_current_state()
         self.state.board_size = board_size
         
+        # Game time advances in fixed ticks; wall-clock time only decides how many to run
+        self.tick = 0
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate
+        self.max_catchup_ticks = 8
+        self._accumulator = 0.0
+        # Timed events (ability expiry, power-ups) fire from here as ticks advance
+        self.timers = TimerWheel(tick_rate=tick_rate)
+        
+        # Optional CommandRecorder (see game/replay.py)
+        self.recorder = None
+        
+        # Optional callable receiving the "timestamps" dict of the command behind each turn,
+        # called when that turn actually moves the snake (see core/latency.py)
+        self.turn_listener = None
+        self._pending_turn_timestamps = None
+        
         self.snake = None
-        self.phase_ability = PhaseAbility()
-        self.boost_ability = BoostAbility()
+        self.phase_ability = PhaseAbility(self.timers)
+        self.boost_ability = BoostAbility(self.timers)
+        self.powerups = PowerUpManager(self) if powerups else None
         
         self.last_update_time = time.time()
         self.move_timer = 0.0
         self.base_move_delay = 0.3  # Seconds between moves at difficulty 1.0
         
+    def game_time(self) -> float:
+        """Seconds of simulated time elapsed, derived from the tick counter."""
+        return self.tick * self.tick_dt
+        
     def reset(self):
+        if self.recorder:
+            self.recorder.on_reset(self.tick)
+        self._start_new_game()
+        
+    def _start_new_game(self):
         self.state_manager.start_game()
         self.snake = Snake(self.board.get_center())
-        self.state.food_position = self.board.get_random_empty_position(self.snake.get_positions())
+        if self.powerups:
+            self.powerups.start()
+        self.state.food_position = self.board.get_random_empty_position(self.occupied_positions())
+        self.state.snake_head = self.snake.head
+        self.state.snake_body = list(self.snake.body)
+        self.state.snake_direction = self.snake.direction
         self.last_update_time = time.time()
+        self._accumulator = 0.0
+        self._pending_turn_timestamps = None
         
     def process_command(self, commands: Dict[str, Any]):
         """
         Interprets a command dictionary from vision or keyboard.
         Expected format: {"direction": "UP"|..., "phase": bool, "boost": bool}
+        An optional "timestamps" dict is handed to turn_listener once the turn it caused is made.
         """
+        if self.recorder:
+            self.recorder.on_command(self.tick, commands)
+            
         if self.state.status != GameStatus.PLAYING:
             if commands.get("restart"):
-                self.reset()
+                self._start_new_game()
             return
 
         # Direction mapping
         dir_cmd = commands.get("direction")
+        requested = self.snake.pending_direction
         if dir_cmd:
             if isinstance(dir_cmd, str):
                 try:
@@ -57,21 +107,44 @@ class GameEngine:
             elif isinstance(dir_cmd, GameCommand):
                 self.snake.set_direction(dir_cmd)
                 
+        # Remember which input asked for a new direction, for latency measurement
+        if self.snake.pending_direction != requested:
+            self._pending_turn_timestamps = commands.get("timestamps")
+                
         # Abilities
         if commands.get("phase"):
-            self.phase_ability.activate()
+            if self.phase_ability.activate():
+                telemetry.count("phase_activations")
+            self.state.phase_active = self.phase_ability.is_active
             
         self.state.boost_active = bool(commands.get("boost"))
         
     def update(self):
-        """Main update logic called every frame."""
-        if self.state.status != GameStatus.PLAYING:
-            return
-            
+        """Main update logic called every frame; runs the ticks due since the last call."""
         now = time.time()
-        dt = now - self.last_update_time
+        self._accumulator += now - self.last_update_time
         self.last_update_time = now
         
+        steps = 0
+        while self._accumulator >= self.tick_dt and steps < self.max_catchup_ticks:
+            self._accumulator -= self.tick_dt
+            self.step()
+            steps += 1
+            
+        # Drop time we could not catch up on instead of spiralling
+        if steps == self.max_catchup_ticks:
+            self._accumulator = 0.0
+            
+    def step(self):
+        """Advances the simulation by exactly one tick. Used directly for headless runs."""
+        self.tick += 1
+        self.timers.advance(self.tick)
+        if self.state.status == GameStatus.PLAYING:
+            self._simulate(self.tick_dt)
+        if self.recorder:
+            self.recorder.on_step(self.tick)
+            
+    def _simulate(self, dt: float):
         # Update abilities
         self.boost_ability.update(dt, self.state.boost_active)
         self.state.phase_active = self.phase_ability.is_active
@@ -82,6 +155,8 @@ class GameEngine:
         speed_multiplier = self.state.difficulty
         if self.state.boost_active and self.boost_ability.is_active:
             speed_multiplier *= 2.0
+        if self.state.speed_tile_active:
+            speed_multiplier *= 1.5
             
         current_move_delay = self.base_move_delay / speed_multiplier
         self.move_timer += dt
@@ -93,27 +168,64 @@ class GameEngine:
     def _do_move(self):
         """Performs a single movement step with screen wrapping."""
         # Enable wrapping by passing board dimensions
+        previous_direction = self.snake.direction
         self.snake.move(board_size=(self.board.width, self.board.height))
         head = self.snake.head
         
+        if self.snake.direction != previous_direction and self._pending_turn_timestamps is not None:
+            if self.turn_listener:
+                self.turn_listener(self._pending_turn_timestamps)
+            self._pending_turn_timestamps = None
+        
         # 1. Wall Collision (Removed as requested - snake now wraps)
             
         # 2. Check Self Collision
         if self.snake.check_collision_with_self(self.state.phase_active):
             if self.state.phase_active:
-                logger.info("Self-collision IGNORED due to Phase Mode")
+                telemetry.count("phased_collisions")
+                logger.debug("Self-collision ignored due to Phase Mode")
             else:
+                telemetry.count("collisions")
                 logger.warning("GAME OVER: Snake hit itself!")
                 self.state_manager.end_game()
                 return
             
-        # 3. Check Food Consumption
+        # 3. Timed board items (bonus food, speed tiles, temporary walls)
+        if self.powerups and not self.powerups.on_head_moved(head):
+            telemetry.count("collisions")
+            logger.warning("GAME OVER: Snake hit a wall!")
+            self.state_manager.end_game()
+            return
+            
+        # 4. Check Food Consumption
         if head.x == self.state.food_position.x and head.y == self.state.food_position.y:
             self.snake.grow()
             self.state_manager.update_score(10)
-            self.state.food_position = self.board.get_random_empty_position(self.snake.get_positions())
+            telemetry.count("food_eaten")
+            self.state.food_position = self.board.get_random_empty_position(self.occupied_positions())
             
         # Sync simple fields to state for UI view
         self.state.snake_head = head
         self.state.snake_body = list(self.snake.body)
         self.state.snake_direction = self.snake.direction
+        
+    def occupied_positions(self) -> list:
+        """Cells new food or items must not be placed on."""
+        occupied = list(self.snake.get_positions())
+        if self.state.food_position:
+            occupied.append(self.state.food_position)
+        if self.powerups:
+            occupied.extend(self.powerups.positions())
+        return occupied
+        
+    def state_hash(self) -> str:
+        """Short digest of the simulation state, used to detect replay divergence."""
+        s = self.state
+        snapshot = (
+            self.tick, s.status.name, s.score, s.difficulty,
+            tuple((p.x, p.y) for p in s.snake_body), s.snake_direction.name,
+            tuple(s.food_position) if s.food_position else None,
+            s.phase_active, s.boost_meter, self.move_timer,
+            tuple((i.kind.name, i.position.x, i.position.y) for i in s.board_items), s.speed_tile_active
+        )
+        return hashlib.blake2b(repr(snapshot).encode(), digest_size=8).hexdigest()
@@ -0,0 +1,110 @@
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from core.event_types import BoardItem, ItemKind, Point, GameStatus
+from game.timer_wheel import Timer
+
+# Seconds an item stays on the board before it expires
+ITEM_LIFETIMES = {
+    ItemKind.BONUS_FOOD: 6.0,
+    ItemKind.SPEED_TILE: 8.0,
+    ItemKind.TEMP_WALL: 10.0,
+}
+
+class PowerUpManager:
+    """
+    Timed pickups and obstacles on the board.
+
+    Every expiry (item lifetime, speed effect, next spawn) is an event on the
+    engine's timer wheel, so nothing here is polled per tick.
+    """
+
+    def __init__(self, engine, spawn_interval: float = 2.0, max_items: int = 12,
+                 bonus_points: int = 25, speed_duration: float = 4.0):
+        self.engine = engine
+        self.spawn_interval = spawn_interval
+        self.max_items = max_items
+        self.bonus_points = bonus_points
+        self.speed_duration = speed_duration
+        self._items: Dict[Tuple[int, int], Tuple[BoardItem, Timer]] = {}
+        self._spawner: Optional[Timer] = None
+        self._speed_timer: Optional[Timer] = None
+
+    def start(self):
+        """Clears the board and starts spawning for a new game."""
+        timers = self.engine.timers
+        for _, timer in self._items.values():
+            timers.cancel(timer)
+        self._items.clear()
+        timers.cancel(self._speed_timer)
+        timers.cancel(self._spawner)
+        self.engine.state.speed_tile_active = False
+        self._sync_state()
+        self._spawner = timers.schedule_after(self.spawn_interval, self._spawn)
+
+    def positions(self) -> List[Point]:
+        return [item.position for item, _ in self._items.values()]
+
+    def _sync_state(self):
+        self.engine.state.board_items = [item for item, _ in self._items.values()]
+
+    def _spawn(self):
+        engine = self.engine
+        if engine.state.status != GameStatus.PLAYING:
+            self._spawner = None
+            return
+        self._spawner = engine.timers.schedule_after(self.spawn_interval, self._spawn)
+        if len(self._items) >= self.max_items:
+            return
+
+        kind = engine.rng.choice(list(ItemKind))
+        position = engine.board.get_random_empty_position(engine.occupied_positions())
+        if position.x < 0:
+            return
+        self.place(kind, position)
+
+    def place(self, kind: ItemKind, position: Point, lifetime: Optional[float] = None) -> BoardItem:
+        """
+        Puts an item on the board until it is picked up or its lifetime (default:
+        ITEM_LIFETIMES) runs out. Replaces any item already on that cell.
+        """
+        timers = self.engine.timers
+        lifetime = ITEM_LIFETIMES[kind] if lifetime is None else lifetime
+        key = (position.x, position.y)
+        if key in self._items:
+            timers.cancel(self._items[key][1])
+        item = BoardItem(kind, position, timers.time + lifetime)
+        self._items[key] = (item, timers.schedule_after(lifetime, partial(self._expire, key)))
+        self._sync_state()
+        return item
+
+    def _expire(self, key: Tuple[int, int]):
+        if self._items.pop(key, None):
+            self._sync_state()
+
+    def _end_speed(self):
+        self.engine.state.speed_tile_active = False
+        self._speed_timer = None
+
+    def on_head_moved(self, head: Point) -> bool:
+        """Applies whatever item the head landed on. Returns False if the snake hit a wall."""
+        entry = self._items.get((head.x, head.y))
+        if entry is None:
+            return True
+        item, timer = entry
+        engine = self.engine
+
+        if item.kind == ItemKind.TEMP_WALL:
+            return engine.state.phase_active
+
+        del self._items[(head.x, head.y)]
+        engine.timers.cancel(timer)
+        if item.kind == ItemKind.BONUS_FOOD:
+            engine.snake.grow()
+            engine.state_manager.update_score(self.bonus_points)
+        elif item.kind == ItemKind.SPEED_TILE:
+            engine.timers.cancel(self._speed_timer)
+            engine.state.speed_tile_active = True
+            self._speed_timer = engine.timers.schedule_after(self.speed_duration, self._end_speed)
+        self._sync_state()
+        return True
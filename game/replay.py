@@ -0,0 +1,222 @@
+import os
+import gzip
+import json
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple, Optional
+
+from core.event_types import GameCommand
+from game.engine import GameEngine
+
+logger = logging.getLogger("pybite.replay")
+
+LOG_VERSION = 1
+
+# Commands are packed into a small integer: 3 bits of direction plus flag bits
+_DIRECTIONS = [None, "UP", "DOWN", "LEFT", "RIGHT"]
+PHASE_BIT = 1 << 3
+BOOST_BIT = 1 << 4
+RESTART_BIT = 1 << 5
+RESET_EVENT = 1 << 6  # Not a command: the app called engine.reset() directly
+
+
+class ReplayDivergenceError(Exception):
+    """Raised when a replayed session's state hash differs from the recorded one."""
+
+    def __init__(self, tick: int, expected: str, actual: str):
+        super().__init__(f"Replay diverged at tick {tick}: expected {expected}, got {actual}")
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+def encode_command(commands: Dict[str, Any]) -> int:
+    """Packs a command dictionary into an integer code."""
+    direction = commands.get("direction")
+    if isinstance(direction, GameCommand):
+        direction = direction.name
+    code = _DIRECTIONS.index(direction) if direction in _DIRECTIONS else 0
+    if commands.get("phase"):
+        code |= PHASE_BIT
+    if commands.get("boost"):
+        code |= BOOST_BIT
+    if commands.get("restart"):
+        code |= RESTART_BIT
+    return code
+
+
+def decode_command(code: int) -> Dict[str, Any]:
+    """Inverse of encode_command."""
+    return {
+        "direction": _DIRECTIONS[code & 0b111],
+        "phase": bool(code & PHASE_BIT),
+        "boost": bool(code & BOOST_BIT),
+        "restart": bool(code & RESTART_BIT),
+    }
+
+
+@dataclass
+class CommandLog:
+    """A seeded, tick-indexed log of everything fed into a GameEngine."""
+    seed: int
+    board_size: Tuple[int, int]
+    tick_rate: int
+    powerups: bool = False
+    hash_interval: int = 600
+    final_tick: int = 0
+    events: List[Tuple[int, int]] = field(default_factory=list)  # (tick, code)
+    hashes: List[Tuple[int, str]] = field(default_factory=list)  # (tick, state hash)
+
+    def save(self, path: str):
+        """Writes the log as gzipped JSON with run-length encoded events."""
+        runs = []
+        prev_tick = 0
+        for tick, code in self.events:
+            delta = tick - prev_tick
+            prev_tick = tick
+            # Collapse repeats of the same command at the same cadence
+            if runs and runs[-1][0] == delta and runs[-1][1] == code:
+                runs[-1][2] += 1
+            else:
+                runs.append([delta, code, 1])
+
+        payload = {
+            "version": LOG_VERSION,
+            "seed": self.seed,
+            "board_size": list(self.board_size),
+            "tick_rate": self.tick_rate,
+            "powerups": self.powerups,
+            "hash_interval": self.hash_interval,
+            "final_tick": self.final_tick,
+            "events": runs,
+            "hashes": self.hashes,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "CommandLog":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != LOG_VERSION:
+            raise ValueError(f"Unsupported command log version: {payload.get('version')}")
+
+        events = []
+        tick = 0
+        for delta, code, count in payload["events"]:
+            for _ in range(count):
+                tick += delta
+                events.append((tick, code))
+
+        return cls(
+            seed=payload["seed"],
+            board_size=tuple(payload["board_size"]),
+            tick_rate=payload["tick_rate"],
+            powerups=payload.get("powerups", False),
+            hash_interval=payload["hash_interval"],
+            final_tick=payload["final_tick"],
+            events=events,
+            hashes=[(t, h) for t, h in payload["hashes"]],
+        )
+
+
+def player_log_path(path: str, player: int) -> str:
+    """
+    Where each player's log goes when a multi-player session is recorded.
+    Player 1 keeps path itself; player 2 of session.pblog writes session.p2.pblog.
+    """
+    if player == 0:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.p{player + 1}{ext}"
+
+
+class CommandRecorder:
+    """Attaches to a GameEngine and records its inputs into a CommandLog."""
+
+    def __init__(self, engine: GameEngine, hash_interval: int = 600):
+        self.engine = engine
+        self.log = CommandLog(
+            seed=engine.seed,
+            board_size=(engine.board.width, engine.board.height),
+            tick_rate=engine.tick_rate,
+            powerups=engine.powerups is not None,
+            hash_interval=hash_interval,
+        )
+        engine.recorder = self
+
+    def on_command(self, tick: int, commands: Dict[str, Any]):
+        self.log.events.append((tick, encode_command(commands)))
+
+    def on_reset(self, tick: int):
+        self.log.events.append((tick, RESET_EVENT))
+
+    def on_step(self, tick: int):
+        self.log.final_tick = tick
+        if tick % self.log.hash_interval == 0:
+            self.log.hashes.append((tick, self.engine.state_hash()))
+
+    def save(self, path: str):
+        self.log.save(path)
+        logger.info("Saved command log: %d events, %d ticks -> %s", len(self.log.events), self.log.final_tick, path)
+
+
+class Replayer:
+    """
+    Steps a GameEngine through a command log, headless.
+    Raises ReplayDivergenceError if verify is set and a recorded hash does not match.
+    """
+
+    def __init__(self, log: CommandLog, verify: bool = True, engine: Optional[GameEngine] = None):
+        self.log = log
+        self.engine = engine or GameEngine(board_size=tuple(log.board_size), seed=log.seed,
+                                           tick_rate=log.tick_rate, powerups=log.powerups)
+        self.last_command: Dict[str, Any] = {}
+        self._expected = dict(log.hashes) if verify else {}
+        self._next_event = 0
+
+    def _step_to(self, target: int):
+        engine = self.engine
+        while engine.tick < target:
+            engine.step()
+            if engine.tick in self._expected:
+                actual = engine.state_hash()
+                if actual != self._expected[engine.tick]:
+                    raise ReplayDivergenceError(engine.tick, self._expected[engine.tick], actual)
+
+    def advance_to(self, target: int):
+        """Runs up to tick target, including the inputs recorded at that tick."""
+        events = self.log.events
+        while self._next_event < len(events) and events[self._next_event][0] <= target:
+            tick, code = events[self._next_event]
+            self._step_to(tick)
+            if code & RESET_EVENT:
+                self.engine.reset()
+            else:
+                self.last_command = decode_command(code)
+                self.engine.process_command(self.last_command)
+            self._next_event += 1
+        self._step_to(target)
+
+
+def replay(log: CommandLog, verify: bool = True, engine: Optional[GameEngine] = None) -> GameEngine:
+    """Re-runs a command log headless, as fast as the CPU allows."""
+    replayer = Replayer(log, verify=verify, engine=engine)
+    replayer.advance_to(log.final_tick)
+    return replayer.engine
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        print("Usage: python -m game.replay <session.pblog>")
+        sys.exit(2)
+
+    session = CommandLog.load(sys.argv[1])
+    start = time.perf_counter()
+    final = replay(session)
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {final.tick} ticks in {elapsed:.3f}s "
+          f"({final.tick / max(elapsed, 1e-9):,.0f} ticks/s), final score {final.state.score}")
@@ -24,6 +24,11 @@ class Snake:
         if command in opposites and command != opposites.get(self.direction):
             self._next_direction = command
             
+    @property
+    def pending_direction(self) -> GameCommand:
+        """Direction the snake will take on its next move."""
+        return self._next_direction
+        
     def move(self, board_size: Optional[tuple] = None):
         """Updates snake body positions based on current direction with optional wrapping."""
         self.direction = self._next_direction
@@ -0,0 +1,102 @@
+import math
+from typing import Callable, List, Optional
+
+
+class Timer:
+    """Handle for a scheduled event; pass it to TimerWheel.cancel to drop the event."""
+    __slots__ = ("expires", "callback", "cancelled")
+
+    def __init__(self, expires: int, callback: Callable[[], None]):
+        self.expires = expires
+        self.callback = callback
+        self.cancelled = False
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel driven by the engine's tick counter.
+
+    Level 0 has one slot per tick; each higher level's slot spans a whole
+    rotation of the level below. A timer is filed by how far away it is and
+    cascades down a level each time the wheel below wraps. Each tick only
+    touches the events due on that tick, however many are pending.
+    """
+
+    def __init__(self, tick_rate: int = 60, slot_bits: int = 6, levels: int = 4):
+        self.tick_rate = tick_rate
+        self.tick = 0  # Last tick processed
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._wheels: List[List[List[Timer]]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._pending
+
+    @property
+    def time(self) -> float:
+        """Seconds of game time at the last processed tick."""
+        return self.tick / self.tick_rate
+
+    def schedule(self, delay_ticks: int, callback: Callable[[], None]) -> Timer:
+        """Runs callback delay_ticks from now (at least one tick)."""
+        timer = Timer(self.tick + max(1, delay_ticks), callback)
+        self._file(timer)
+        self._pending += 1
+        return timer
+
+    def schedule_after(self, seconds: float, callback: Callable[[], None]) -> Timer:
+        """Runs callback on the first tick at or after seconds of game time from now."""
+        return self.schedule(math.ceil(seconds * self.tick_rate - 1e-9), callback)
+
+    def cancel(self, timer: Optional[Timer]):
+        # Cancelled timers stay in their slot and are skipped when it comes round
+        if timer is not None and not timer.cancelled:
+            timer.cancelled = True
+            self._pending -= 1
+
+    def _file(self, timer: Timer):
+        base = self.tick + 1  # Next tick to be processed
+        expires = max(timer.expires, base)
+        delta = expires - base
+        for level in range(self._levels):
+            if delta < 1 << (self._bits * (level + 1)):
+                slot = (expires >> (self._bits * level)) & self._mask
+                self._wheels[level][slot].append(timer)
+                return
+        # Beyond the wheel's reach: park in the farthest top-level slot and re-file on cascade
+        level = self._levels - 1
+        farthest = base + (1 << (self._bits * self._levels)) - 1
+        self._wheels[level][(farthest >> (self._bits * level)) & self._mask].append(timer)
+
+    def advance(self, to_tick: int):
+        """Processes every tick up to and including to_tick, firing due events in order."""
+        while self.tick < to_tick:
+            t = self.tick + 1
+            index = t & self._mask
+
+            # Level 0 wrapped: pull the next slot of each higher level down
+            if index == 0:
+                for level in range(1, self._levels):
+                    slot = (t >> (self._bits * level)) & self._mask
+                    bucket = self._wheels[level][slot]
+                    self._wheels[level][slot] = []
+                    for timer in bucket:
+                        if not timer.cancelled:
+                            self._file(timer)
+                    if slot != 0:
+                        break
+
+            self.tick = t
+            bucket = self._wheels[0][index]
+            if not bucket:
+                continue
+            self._wheels[0][index] = []
+            for timer in bucket:
+                if not timer.cancelled:
+                    timer.cancelled = True
+                    self._pending -= 1
+                    timer.callback()
@@ -0,0 +1,38 @@
+import random
+from core.event_types import GameStatus
+from game.engine import GameEngine
+from game.autopilot import Autopilot, DistanceField
+
+def _fresh_distances(field: DistanceField):
+    reference = DistanceField(field.width, field.height)
+    reference.blocked = bytearray(field.blocked)
+    reference.set_target(field.target)
+    reference.advance(field.width * field.height)
+    return reference.dist
+
+def test_incremental_field_matches_full_bfs():
+    rng = random.Random(7)
+    field = DistanceField(12, 9)
+    field.set_target(field.index(3, 4))
+    field.advance(10)  # Partially built; changes below must be deferred
+    cells = [i for i in range(12 * 9) if i != field.target]
+    for _ in range(200):
+        cell = rng.choice(cells)
+        if field.blocked[cell]:
+            field.free(cell)
+        else:
+            field.block(cell)
+        field.advance(25)
+    field.advance(12 * 9)
+    assert field.dist == _fresh_distances(field)
+
+def test_autopilot_plays_and_scores():
+    engine = GameEngine(board_size=(20, 20), seed=3)
+    pilot = Autopilot()
+    engine.reset()
+    for _ in range(6000):
+        engine.process_command(pilot.get_command(engine.state))
+        engine.step()
+        if engine.state.status != GameStatus.PLAYING:
+            break
+    assert engine.state.score >= 100
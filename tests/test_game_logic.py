@@ -28,18 +28,20 @@ def test_collision_detection():
     assert board.is_within_bounds(Point(10, 10)) == True
     assert board.is_within_bounds(Point(25, 10)) == False
 
-def test_engine_game_over_wall():
+def test_engine_wraps_at_wall():
     engine = GameEngine(board_size=(10, 10))
     engine.reset()
-    engine.state.status = GameStatus.PLAYING
+    engine.state.food_position = Point(5, 5)
     
     # Force snake to the edge
     engine.snake.head = Point(0, 0)
+    engine.snake.body = [Point(0, 0), Point(0, 1), Point(0, 2)]
     engine.snake.set_direction(GameCommand.LEFT)
     
-    # Should collide with wall on next move
+    # The board wraps: the snake comes out on the opposite edge and play goes on
     engine._do_move()
-    assert engine.state.status == GameStatus.GAME_OVER
+    assert engine.state.status == GameStatus.PLAYING
+    assert engine.snake.head == Point(9, 0)
 
 def test_phase_ability():
     engine = GameEngine(board_size=(20, 20))
@@ -0,0 +1,40 @@
+import numpy as np
+
+from vision.gesture_classifier import (GestureModel, GestureSamples, LearnedGestureInterpreter,
+                                       landmark_features, synthetic_samples)
+from vision.synthetic_source import synthetic_hand
+
+def test_features_ignore_hand_position_and_size():
+    near = landmark_features(synthetic_hand("LEFT", x=0.3, y=0.4, scale=1.5))
+    far = landmark_features(synthetic_hand("LEFT", x=0.7, y=0.6, scale=0.5))
+    assert np.allclose(near, far, atol=1e-5)
+    batch = landmark_features(np.array([synthetic_hand("UP"), synthetic_hand("DOWN")]))
+    assert batch.shape == (2, near.shape[0])
+
+def test_trained_model_matches_labels(tmp_path):
+    train_set, test_set = synthetic_samples(1500, seed=1).split(seed=1)
+    model = GestureModel.train(train_set, epochs=400)
+
+    path = str(tmp_path / "gestures.npz")
+    model.save(path)
+    direction, phase, boost = GestureModel.load(path).predict(test_set)
+    assert np.mean(direction == test_set.direction) > 0.95
+    assert np.mean(phase == test_set.phase) > 0.95
+    assert np.mean(boost == test_set.boost) > 0.95
+
+def test_learned_interpreter_is_a_drop_in(tmp_path):
+    samples = synthetic_samples(1000, seed=2)
+    path = str(tmp_path / "samples.npz")
+    samples.save(path)
+    interpreter = LearnedGestureInterpreter(GestureModel.train(GestureSamples.load(path), epochs=400))
+
+    command = interpreter.get_command(synthetic_hand("RIGHT", scale=0.5))
+    assert command["direction"] == "RIGHT"
+    assert not command["phase"] and not command["boost"]
+    assert set(command) == {"direction", "phase", "boost", "raw", "pinch_distance"}
+    assert interpreter.get_command(synthetic_hand(None, fist=True))["boost"]
+    assert interpreter.get_command([])["direction"] is None
+
+    # Both players' hands go through the model in one batch, with the same answers
+    hands = synthetic_samples(50, seed=3).landmarks.tolist()
+    assert interpreter.get_commands(hands) == [interpreter.classify(hand) for hand in hands]
@@ -0,0 +1,63 @@
+import logging
+
+import numpy as np
+
+from vision.hand_assigner import HandAssigner
+from vision.gesture_interpreter import GestureInterpreter
+from vision.gesture_classifier import synthetic_samples
+from vision.synthetic_source import synthetic_hand
+
+def _hand(x, y, tip_dx=0.0):
+    """Synthetic open hand centred at (x, y); tip_dx tilts the index finger."""
+    lms = [(x, y + 0.1, 0.0)] * 21
+    lms[5] = (x, y, 0.0)
+    lms[8] = (x + tip_dx, y - 0.01, 0.0)
+    lms[9] = (x, y, 0.0)
+    for tip in (12, 16, 20):
+        lms[tip] = (x, y - 0.2, 0.0)
+    return lms
+
+def test_initial_assignment_by_position():
+    assigner = HandAssigner(num_players=2)
+    left, right = _hand(0.2, 0.5), _hand(0.8, 0.5)
+    p1, p2 = assigner.assign([("Left", right), ("Right", left)])
+    assert p1 is left and p2 is right
+
+def test_assignment_follows_hands_across_frames():
+    assigner = HandAssigner(num_players=2)
+    assigner.assign([("Right", _hand(0.3, 0.5)), ("Left", _hand(0.7, 0.5))])
+    # Hands drift towards the middle and MediaPipe reports them in the other order
+    a, b = _hand(0.45, 0.5), _hand(0.55, 0.5)
+    p1, p2 = assigner.assign([("Left", b), ("Right", a)])
+    assert p1 is a and p2 is b
+
+def test_missing_hand_keeps_other_player_slot():
+    assigner = HandAssigner(num_players=2)
+    assigner.assign([("Right", _hand(0.3, 0.5)), ("Left", _hand(0.7, 0.5))])
+    only = _hand(0.68, 0.5)
+    p1, p2 = assigner.assign([("Left", only)])
+    assert p1 == [] and p2 is only
+
+def test_batched_commands_per_player():
+    interpreter = GestureInterpreter()
+    left, right = interpreter.get_commands([_hand(0.2, 0.5, tip_dx=-0.1), _hand(0.8, 0.5, tip_dx=0.1)])
+    assert left["direction"] == "LEFT"
+    assert right["direction"] == "RIGHT"
+    assert interpreter.get_commands([[]])[0]["direction"] is None
+
+def test_batched_pass_matches_per_hand_rules():
+    hands = synthetic_samples(300, seed=3).landmarks.astype(np.float64).tolist()
+    interpreter = GestureInterpreter()
+    assert interpreter.classify_batch(np.array(hands)) == [interpreter.classify(hand) for hand in hands]
+    # Absent hands are skipped by the batch and still get an empty command
+    commands = interpreter.get_commands([hands[0], [], hands[1]])
+    assert commands[1]["direction"] is None
+    assert [commands[0], commands[2]] == [interpreter.classify(hands[0]), interpreter.classify(hands[1])]
+
+def test_pinch_onset_logs_the_distance(caplog):
+    interpreter = GestureInterpreter()
+    command = interpreter.classify(synthetic_hand(None, pinch=True))
+    assert command["phase"] and command["pinch_distance"] < interpreter.pinch_threshold
+    with caplog.at_level(logging.INFO, logger="pybite.vision"):
+        interpreter.get_commands([synthetic_hand(None, pinch=True)])
+    assert f"P1 PINCH: distance {command['pinch_distance']:.4f}" in caplog.text
@@ -0,0 +1,32 @@
+from core.latency import LatencyTracker
+from game.engine import GameEngine
+from app.latency_bench import run_latency_benchmark
+
+def test_tracker_splits_stages():
+    tracker = LatencyTracker()
+    tracker.record({"captured": 1.000, "tracked": 1.020, "commanded": 1.025, "flipped": 1.100})
+    assert abs(tracker.percentiles("captured->tracked")["p50"] - 20.0) < 1e-6
+    assert abs(tracker.percentiles("end_to_end")["max"] - 100.0) < 1e-6
+    assert tracker.percentiles("moved->flipped") is None
+
+def test_engine_reports_turn_when_it_moves():
+    engine = GameEngine(board_size=(20, 20), seed=1)
+    landed = []
+    engine.turn_listener = landed.append
+    engine.reset()
+
+    engine.process_command({"direction": "LEFT", "timestamps": {"captured": 1.0}})
+    engine.process_command({"direction": "LEFT", "timestamps": {"captured": 2.0}})
+    assert landed == []
+    engine._do_move()
+    assert landed == [{"captured": 1.0}]  # Onset, not the later repeat of the same gesture
+
+    engine._do_move()
+    assert len(landed) == 1
+
+def test_synthetic_benchmark_bounds():
+    latency = run_latency_benchmark(duration=30.0, seed=2)
+    stats = latency.percentiles("end_to_end")
+    assert stats["count"] >= 25
+    # One frame of sampling plus at most one move delay at difficulty 1.0
+    assert stats["max"] <= 300.0 + 1000 / 30
@@ -0,0 +1,70 @@
+from core.event_types import ItemKind, Point, GameStatus
+from game.engine import GameEngine
+from game.powerups import ITEM_LIFETIMES
+from game.replay import CommandRecorder, replay
+
+def _engine_with_item_ahead(kind, lifetime=None):
+    engine = GameEngine(board_size=(20, 20), seed=2, powerups=True)
+    engine.reset()
+    head = engine.snake.head
+    ahead = Point(head.x, head.y - 1)  # New snakes move up
+    assert engine.state.food_position != ahead
+    engine.powerups.place(kind, ahead, lifetime)
+    return engine
+
+def _step_until_moved(engine):
+    head = engine.snake.head
+    while engine.snake.head == head:
+        engine.step()
+
+def test_bonus_food_and_speed_tile_pickups():
+    engine = _engine_with_item_ahead(ItemKind.BONUS_FOOD)
+    _step_until_moved(engine)
+    assert engine.state.score == 25
+    assert engine.state.board_items == []
+
+    engine = _engine_with_item_ahead(ItemKind.SPEED_TILE)
+    _step_until_moved(engine)
+    assert engine.state.speed_tile_active
+    for _ in range(int(engine.powerups.speed_duration * engine.tick_rate)):
+        engine.step()
+    assert not engine.state.speed_tile_active
+
+def test_temp_wall_ends_game_unless_phased():
+    engine = _engine_with_item_ahead(ItemKind.TEMP_WALL)
+    _step_until_moved(engine)
+    assert engine.state.status == GameStatus.GAME_OVER
+
+    engine = _engine_with_item_ahead(ItemKind.TEMP_WALL)
+    engine.process_command({"phase": True})
+    _step_until_moved(engine)
+    assert engine.state.status == GameStatus.PLAYING
+
+def test_placed_items_expire_after_their_lifetime():
+    engine = GameEngine(board_size=(20, 20), seed=3, powerups=True)
+    engine.powerups.spawn_interval = 60.0  # Keep random spawns off the board
+    engine.reset()
+    wall = engine.powerups.place(ItemKind.TEMP_WALL, Point(0, 0))
+    bonus = engine.powerups.place(ItemKind.BONUS_FOOD, Point(1, 0), lifetime=0.5)
+    assert wall.expires_at == ITEM_LIFETIMES[ItemKind.TEMP_WALL]
+
+    for _ in range(int(0.5 * engine.tick_rate) - 1):
+        engine.step()
+    assert engine.state.board_items == [wall, bonus]
+    engine.step()
+    assert engine.state.board_items == [wall]
+
+def test_items_spawn_expire_and_replay():
+    engine = GameEngine(board_size=(20, 20), seed=11, powerups=True)
+    recorder = CommandRecorder(engine, hash_interval=120)
+    engine.reset()
+    seen = 0
+    for t in range(3600):
+        if t % 40 == 0:
+            engine.process_command({"direction": ("LEFT", "UP", "RIGHT", "UP")[(t // 40) % 4]})
+        engine.step()
+        seen = max(seen, len(engine.state.board_items))
+        for item in engine.state.board_items:
+            assert item.expires_at > engine.game_time() - 1e-9
+    assert seen > 0
+    assert replay(recorder.log).state_hash() == engine.state_hash()
@@ -0,0 +1,54 @@
+from core.quality_governor import QualityGovernor
+from vision.landmark_extrapolator import LandmarkExtrapolator
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def _run_frames(governor, clock, count, frame_time):
+    changes = 0
+    for _ in range(count):
+        governor.begin_frame()
+        with governor.stage("vision"):
+            clock.now += frame_time
+        changes += governor.end_frame()
+    return changes
+
+def test_governor_steps_down_under_load_and_recovers():
+    clock = FakeClock()
+    governor = QualityGovernor(target_frame_time=0.033, downgrade_after=10, upgrade_after=30, clock=clock)
+
+    _run_frames(governor, clock, 5, 0.050)
+    assert governor.level_index == 0  # A short spike is tolerated
+
+    _run_frames(governor, clock, 5, 0.050)
+    assert governor.level_index == 1
+    assert governor.stage_times["vision"] > 0.033
+
+    _run_frames(governor, clock, 40, 0.010)
+    assert governor.level_index == 0
+
+def test_governor_never_leaves_ladder():
+    clock = FakeClock()
+    governor = QualityGovernor(target_frame_time=0.033, downgrade_after=5, clock=clock)
+    _run_frames(governor, clock, 500, 0.2)
+    assert governor.level is governor.ladder[-1]
+
+def test_fixed_quality_only_measures():
+    clock = FakeClock()
+    governor = QualityGovernor(target_frame_time=0.033, downgrade_after=5, adaptive=False, clock=clock)
+    assert _run_frames(governor, clock, 50, 0.2) == 0
+    assert governor.level_index == 0
+    assert governor.frame_time > 0.1
+
+def test_extrapolator_projects_linearly_and_caps_horizon():
+    extrapolator = LandmarkExtrapolator(max_horizon=0.1)
+    extrapolator.update(0, [(0.0, 0.5, 0.0)], 0.0)
+    extrapolator.update(0, [(0.1, 0.5, 0.0)], 0.1)
+    assert abs(extrapolator.predict(0, 0.15)[0][0] - 0.15) < 1e-9
+    assert abs(extrapolator.predict(0, 5.0)[0][0] - 0.2) < 1e-9
+    extrapolator.update(0, [], 0.2)
+    assert extrapolator.predict(0, 0.25) == []
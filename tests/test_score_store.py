@@ -0,0 +1,71 @@
+import time
+from core.score_store import ScoreStore, SessionRecord, SessionStats
+from core.state_manager import StateManager
+
+def _session(score: int, day: str = "2024-05-01", player: int = 0) -> SessionRecord:
+    return SessionRecord(started_at=0.0, ended_at=60.0, day=day, player=player, score=score,
+                         duration=60.0, frames=1800, frame_time_mean=0.02)
+
+def test_high_score_persists_across_stores(tmp_path):
+    path = str(tmp_path / "scores.db")
+    store = ScoreStore(path)
+    for score in (30, 120, 70):
+        store.record(_session(score))
+    store.close()
+
+    reopened = ScoreStore(path)
+    assert reopened.high_score() == 120
+    assert StateManager(reopened).state.high_score == 120
+    reopened.close()
+
+def test_leaderboard_and_daily_aggregates(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), batch_size=2)
+    for score, day in [(10, "2024-05-01"), (50, "2024-05-01"), (40, "2024-05-02"), (90, "2024-05-03")]:
+        store.record(_session(score, day))
+    store.close()
+
+    store = ScoreStore(str(tmp_path / "scores.db"))
+    assert [e["score"] for e in store.leaderboard(limit=3)] == [90, 50, 40]
+    assert [e["score"] for e in store.leaderboard(day="2024-05-01")] == [50, 10]
+
+    days = store.daily(since="2024-05-01", until="2024-05-02")
+    assert [d["day"] for d in days] == ["2024-05-01", "2024-05-02"]
+    assert days[0]["sessions"] == 2
+    assert days[0]["mean_score"] == 30
+    assert days[0]["best_score"] == 50
+    assert days[0]["play_time"] == 120.0
+    store.close()
+
+def test_writer_flushes_without_close(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), flush_interval=0.05)
+    store.record(_session(15))
+    reader = ScoreStore(str(tmp_path / "scores.db"))
+    for _ in range(100):
+        if reader.high_score() == 15:
+            break
+        time.sleep(0.02)
+    assert reader.high_score() == 15
+    reader.close()
+    store.close()
+
+def test_session_stats_counts_gesture_onsets():
+    clock = iter([100.0, 145.0]).__next__
+    stats = SessionStats(player=1, clock=clock)
+    stats.start()
+    frames = [
+        {"direction": "UP", "phase": False, "boost": False},
+        {"direction": "UP", "phase": True, "boost": False},
+        {"direction": "LEFT", "phase": True, "boost": True},
+        {"direction": None, "phase": False, "boost": True},
+        {"direction": "LEFT", "phase": True, "boost": False},
+    ]
+    for commands in frames:
+        stats.on_commands(commands)
+        stats.on_frame(0.02)
+    record = stats.finish(score=40)
+
+    assert not stats.running
+    assert (record.player, record.score, record.duration) == (1, 40, 45.0)
+    assert (record.direction_changes, record.pinches, record.fists) == (2, 2, 1)
+    assert record.frames == 5
+    assert abs(record.frame_time_mean - 0.02) < 1e-9
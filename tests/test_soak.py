@@ -0,0 +1,56 @@
+import random
+import pytest
+from core.event_types import Point
+from game.engine import GameEngine
+from game.replay import CommandRecorder
+from app.soak import (InvariantError, SoakHarness, SoakSample, find_trends, gesture_commands,
+                      random_commands, replayed_commands)
+
+def test_random_soak_holds_invariants():
+    engine = GameEngine(board_size=(12, 12), seed=5, powerups=True)
+    report = SoakHarness(engine, random_commands(random.Random(5)), sample_interval=2000).run(30000)
+    assert report.games > 1
+    assert len(report.samples) == 15
+    assert all(s.memory > 0 for s in report.samples)
+
+def test_gesture_and_replayed_soaks_hold_invariants():
+    engine = GameEngine(board_size=(12, 12), seed=8)
+    SoakHarness(engine, gesture_commands(random.Random(8)), sample_interval=1000).run(5000)
+
+    recorded = GameEngine(board_size=(12, 12), seed=9)
+    recorder = CommandRecorder(recorded)
+    recorded.reset()
+    commands = random_commands(random.Random(9), turn_chance=0.1)
+    for _ in range(3000):
+        command = next(commands)
+        if command:
+            recorded.process_command(command)
+        recorded.step()
+    engine = GameEngine(board_size=(12, 12), seed=9)
+    SoakHarness(engine, replayed_commands(recorder.log), sample_interval=1000).run(9000)
+
+def test_invariant_violations_are_reported():
+    engine = GameEngine(board_size=(12, 12), seed=1)
+    harness = SoakHarness(engine, random_commands(random.Random(1)))
+    engine.reset()
+    harness._new_game()
+    harness.check_invariants()
+
+    head = engine.snake.head
+    engine.state.food_position = Point(head.x, head.y)
+    with pytest.raises(InvariantError, match="food"):
+        harness.check_invariants()
+
+    engine.state.food_position = None
+    engine.snake.body.append(engine.snake.body[-1])
+    with pytest.raises(InvariantError, match="body length"):
+        harness.check_invariants()
+
+def test_find_trends_flags_growth():
+    flat = [SoakSample(tick=i * 1000, memory=50000 + (i % 3) * 1000, tick_time=20e-6) for i in range(30)]
+    assert find_trends(flat) == []
+
+    leaking = [SoakSample(tick=s.tick, memory=s.memory + i * 40000, tick_time=s.tick_time) for i, s in enumerate(flat)]
+    slowing = [SoakSample(tick=s.tick, memory=s.memory, tick_time=20e-6 * (1 + i / 10)) for i, s in enumerate(flat)]
+    assert "memory" in find_trends(leaking)[0]
+    assert "tick time" in find_trends(slowing)[0]
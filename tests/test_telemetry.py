@@ -0,0 +1,52 @@
+import queue
+import logging
+from core.telemetry import DroppingQueueHandler, RateLimitFilter, Telemetry, telemetry
+from vision.gesture_interpreter import GestureInterpreter
+from vision.synthetic_source import synthetic_hand
+
+def _record(msg, level=logging.INFO, *args):
+    return logging.LogRecord("pybite.test", level, __file__, 1, msg, args, None)
+
+def test_rate_limit_filter_samples_repeats():
+    now = [0.0]
+    limiter = RateLimitFilter(burst=2, interval=1.0, clock=lambda: now[0])
+    passed = [limiter.filter(_record("DIRECTION: %s", logging.INFO, d)) for d in "abcde"]
+    assert passed == [True, True, False, False, False]
+    assert limiter.filter(_record("other %s", logging.INFO, 1))
+    assert limiter.filter(_record("GAME OVER", logging.WARNING))
+
+    now[0] = 1.5
+    record = _record("DIRECTION: %s", logging.INFO, "f")
+    assert limiter.filter(record)
+    assert record.suppressed == 3
+
+def test_full_queue_drops_without_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    for i in range(5):
+        handler.emit(_record("info %d", logging.INFO, i))
+    assert handler.dropped == 3
+
+    handler.emit(_record("boom", logging.WARNING))
+    queued = [handler.queue.get_nowait().msg for _ in range(2)]
+    assert queued == ["info %d", "boom"]  # Oldest record evicted for the warning
+
+def test_telemetry_windows_and_rates():
+    t = Telemetry(window=1.0, history=3)
+    t.sample(0.0)
+    for second in range(5):
+        t.count("gestures", second + 1)
+        t.sample(second + 1.0)
+    assert len(t.history) == 3
+    assert t.rates() == {"gestures": 5.0}
+    assert t.snapshot()["totals"]["gestures"] == 15
+
+def test_pinch_counts_onsets_not_frames():
+    interpreter = GestureInterpreter()
+    pinch = synthetic_hand("UP")
+    pinch[4] = pinch[8]
+    before = telemetry.current["pinches"]
+    for _ in range(10):
+        assert interpreter.get_command(pinch)["phase"]
+    interpreter.get_command(synthetic_hand("UP"))
+    interpreter.get_command(pinch)
+    assert telemetry.current["pinches"] - before == 2
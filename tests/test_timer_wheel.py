@@ -0,0 +1,49 @@
+import random
+from game.timer_wheel import TimerWheel
+from game.engine import GameEngine
+
+def test_events_fire_on_their_tick_across_levels():
+    rng = random.Random(5)
+    wheel = TimerWheel(slot_bits=4, levels=3)  # Small geometry: reach is 4096 ticks
+    fired, expected, handles = {}, {}, []
+    for i in range(2000):
+        # Mix delays around every level boundary, plus some beyond the wheel's reach
+        delay = rng.choice([1, 15, 16, 17, 255, 256, 257, rng.randrange(1, 4096), 4096 + 7, 20000])
+        handles.append(wheel.schedule(delay, lambda i=i: fired.setdefault(i, wheel.tick)))
+        expected[i] = delay
+    cancelled = set(rng.sample(range(2000), 200))
+    for i in cancelled:
+        wheel.cancel(handles[i])
+    assert len(wheel) == 1800
+
+    wheel.advance(20010)
+    assert fired == {i: d for i, d in expected.items() if i not in cancelled}
+    assert len(wheel) == 0
+
+def test_callbacks_can_reschedule():
+    wheel = TimerWheel(tick_rate=10)
+    ticks = []
+    def every_half_second():
+        ticks.append(wheel.tick)
+        if len(ticks) < 4:
+            wheel.schedule_after(0.5, every_half_second)
+    wheel.schedule_after(0.5, every_half_second)
+    wheel.advance(100)
+    assert ticks == [5, 10, 15, 20]
+
+def test_phase_ability_expires_and_cools_down_on_ticks():
+    engine = GameEngine(board_size=(20, 20), seed=1)
+    engine.reset()
+    ability = engine.phase_ability
+    assert ability.activate()
+    assert not ability.activate()
+
+    for _ in range(int(3.0 * engine.tick_rate) - 1):
+        engine.timers.advance(engine.timers.tick + 1)
+    assert ability.is_active
+    engine.timers.advance(engine.timers.tick + 1)
+    assert not ability.is_active
+    assert abs(ability.cooldown_remaining - 7.0) < 1e-6
+
+    engine.timers.advance(engine.timers.tick + 7 * engine.tick_rate)
+    assert ability.is_ready and ability.cooldown_remaining == 0.0
@@ -0,0 +1,132 @@
+import os
+import time
+
+import numpy as np
+
+from vision.tracker_pool import TrackerPool
+
+class FakeTracker:
+    """Reports the frame's fill value as the wrist x coordinate instead of running MediaPipe."""
+
+    def __init__(self, max_num_hands: int):
+        self.inference_scale = 1.0
+        self.value = None
+        self.frames = 0
+
+    def set_model_complexity(self, model_complexity: int):
+        pass
+
+    def find_hands(self, frame):
+        self.value = int(frame[0, 0, 0])
+        self.frames += 1
+
+    def get_hands(self):
+        return [("Right", [(float(self.value), float(self.frames), 0.0)])]
+
+class FaultyTracker(FakeTracker):
+    """Raises on frames filled with 13 and kills its worker process on frames filled with 66."""
+
+    def find_hands(self, frame):
+        value = int(frame[0, 0, 0])
+        if value == 13:
+            raise ValueError("bad frame")
+        if value == 66:
+            os._exit(1)
+        super().find_hands(frame)
+
+def _frame(value: int):
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+def _drain(pool: TrackerPool, count: int):
+    results = []
+    while len(results) < count:
+        batch = pool.poll(timeout=10.0)
+        assert batch, "tracker pool stopped answering"
+        results.extend(batch)
+    return results
+
+def test_busy_station_cannot_starve_others():
+    pool = TrackerPool(stations=2, frame_size=(64, 48), workers=1, max_in_flight=1, tracker_factory=FakeTracker)
+    try:
+        # Station 0 floods the pool; only its first and newest frames are tracked
+        for value in range(1, 51):
+            pool.submit(0, _frame(value), captured_at=float(value))
+        pool.submit(1, _frame(200), captured_at=100.0)
+
+        results = _drain(pool, 3)
+        tracked = [(station, hands[0][1][0][0]) for station, _, hands in results]
+        assert tracked == [(0, 1.0), (1, 200.0), (0, 50.0)]
+        assert pool.dropped == [48, 0]
+        assert pool.completed == [2, 1]
+    finally:
+        pool.close()
+
+def test_each_station_keeps_one_tracker():
+    pool = TrackerPool(stations=3, frame_size=(64, 48), workers=2, max_in_flight=1, tracker_factory=FakeTracker)
+    try:
+        assert pool.workers == 2
+        seen = {0: [], 1: [], 2: []}
+        for round_ in range(4):
+            for station in range(3):
+                pool.submit(station, _frame(station), captured_at=float(round_))
+            for station, _, hands in _drain(pool, 3):
+                seen[station].append(hands[0][1][0][1])
+        # Each tracker counts the frames it has seen: one tracker per station, fed every frame
+        assert seen == {station: [1.0, 2.0, 3.0, 4.0] for station in range(3)}
+    finally:
+        pool.close()
+
+def test_oversized_frames_are_scaled_into_the_slot():
+    pool = TrackerPool(stations=1, frame_size=(64, 48), workers=1, tracker_factory=FakeTracker)
+    try:
+        pool.submit(0, np.full((96, 128, 3), 7, dtype=np.uint8), captured_at=1.5)
+        (station, captured_at, hands), = _drain(pool, 1)
+        assert (station, captured_at, hands[0][1][0][0]) == (0, 1.5, 7.0)
+    finally:
+        pool.close()
+
+def test_tracking_errors_still_return_a_result():
+    pool = TrackerPool(stations=1, frame_size=(64, 48), workers=1, max_in_flight=1, tracker_factory=FaultyTracker)
+    try:
+        pool.submit(0, _frame(13), captured_at=1.0)
+        assert _drain(pool, 1) == [(0, 1.0, [])]
+        pool.submit(0, _frame(5), captured_at=2.0)
+        (_, _, hands), = _drain(pool, 1)
+        assert hands[0][1][0][0] == 5.0
+        assert pool.errors == [1]
+        assert pool.completed == [2]
+    finally:
+        pool.close()
+
+def test_dead_worker_is_restarted_and_its_slots_returned():
+    pool = TrackerPool(stations=2, frame_size=(64, 48), workers=1, max_in_flight=1, tracker_factory=FaultyTracker)
+    try:
+        pool.submit(0, _frame(66), captured_at=1.0)
+        deadline = time.monotonic() + 10.0
+        while pool.restarts == [0]:
+            assert time.monotonic() < deadline, "dead worker was never noticed"
+            assert pool.poll(timeout=0.1) == []
+        assert pool.dropped == [1, 0]
+
+        # Both stations' slots are usable again on the new worker
+        pool.submit(0, _frame(5), captured_at=2.0)
+        pool.submit(1, _frame(6), captured_at=3.0)
+        tracked = sorted((station, hands[0][1][0][0]) for station, _, hands in _drain(pool, 2))
+        assert tracked == [(0, 5.0), (1, 6.0)]
+        assert not pool.is_down(0)
+    finally:
+        pool.close()
+
+def test_station_is_given_up_after_repeated_crashes(monkeypatch):
+    monkeypatch.setattr("vision.tracker_pool.MAX_RESTARTS", 0)
+    pool = TrackerPool(stations=1, frame_size=(64, 48), workers=1, max_in_flight=1, tracker_factory=FaultyTracker)
+    try:
+        pool.submit(0, _frame(66), captured_at=1.0)
+        deadline = time.monotonic() + 10.0
+        while not pool.is_down(0):
+            assert time.monotonic() < deadline, "dead worker was never noticed"
+            pool.poll(timeout=0.1)
+        pool.submit(0, _frame(5), captured_at=2.0)
+        assert pool.dropped == [2]
+    finally:
+        pool.close()
@@ -0,0 +1,54 @@
+import os
+
+import pygame
+
+from app.video_export import ReplayRenderer, export_replay, split_frames, _frame_tick
+from game.engine import GameEngine
+from game.replay import CommandRecorder, Replayer
+
+def _recorded_log(ticks: int = 120):
+    engine = GameEngine(board_size=(20, 20), seed=42)
+    recorder = CommandRecorder(engine, hash_interval=60)
+    script = ["LEFT", "UP", "RIGHT", "DOWN"]
+    engine.reset()
+    for t in range(ticks):
+        if t % 20 == 0:
+            engine.process_command({"direction": script[(t // 20) % 4], "boost": t % 60 < 10})
+        engine.step()
+    return recorder.log
+
+def _pixels(path: str) -> bytes:
+    return pygame.image.tobytes(pygame.image.load(path), "RGB")
+
+def test_split_frames_covers_every_frame_once():
+    for frames, parts in [(121, 12), (5, 8), (1, 4), (100, 3)]:
+        segments = split_frames(frames, parts)
+        assert segments[0][0] == 0 and segments[-1][1] == frames
+        assert all(end == next_start for (_, end), (next_start, _) in zip(segments, segments[1:]))
+        assert all(start < end for start, end in segments)
+
+def test_frame_ticks_advance_without_repeats():
+    log = _recorded_log()
+    ticks = [_frame_tick(log, 0, 30, frame) for frame in range(61)]
+    assert ticks[0] == 0 and ticks[-1] == log.final_tick
+    assert all(b - a == 2 for a, b in zip(ticks, ticks[1:]))
+
+def test_png_export_matches_a_single_continuous_render(tmp_path):
+    log = _recorded_log()
+    parallel, single = tmp_path / "parallel", tmp_path / "single"
+    # 120 ticks at 60 Hz is two seconds: 61 frames at 30 fps, in 12 segments over 3 workers
+    assert export_replay(log, str(parallel), fps=30, workers=3, png=True) == 61
+    assert export_replay(log, str(single), fps=30, workers=1, png=True) == 61
+
+    names = [f"frame_{frame:08d}.png" for frame in range(61)]
+    assert sorted(os.listdir(parallel)) == names
+    assert sorted(os.listdir(single)) == names
+
+    # Each frame shows the replay clock, so a duplicated or skipped boundary frame would not match
+    replayer = Replayer(log)
+    renderer = ReplayRenderer(replayer)
+    for frame, name in enumerate(names):
+        replayer.advance_to(_frame_tick(log, 0, 30, frame))
+        expected = pygame.image.tobytes(renderer.render(), "RGB")
+        assert _pixels(str(parallel / name)) == expected, name
+        assert _pixels(str(single / name)) == expected, name
@@ -1,15 +1,20 @@
 import cv2
 import threading
 import time
+from typing import Union
 
 class Camera:
     """Threaded camera capture to prevent blocking the game loop."""
     
-    def __init__(self, camera_index: int = 0):
+    def __init__(self, camera_index: Union[int, str] = 0):
+        # An index opens a live camera; a path plays back a recorded video at its native rate
         self.cap = cv2.VideoCapture(camera_index)
+        self.is_playback = isinstance(camera_index, str)
         self.frame = None
+        self.frame_timestamp = None  # time.perf_counter() when self.frame was captured
         self.stopped = False
         self.lock = threading.Lock()
+        self._pending_settings = None
         
         if not self.cap.isOpened():
             print(f"Error: Could not open camera {camera_index}")
@@ -23,7 +28,17 @@ class Camera:
     def _update(self):
         """Internal loop to keep reading frames."""
         while not self.stopped:
+            # Driver settings are applied from the capture thread, between reads
+            with self.lock:
+                settings, self._pending_settings = self._pending_settings, None
+            if settings:
+                width, height, fps = settings
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+                
             ret, frame = self.cap.read()
+            captured_at = time.perf_counter()
             if not ret:
                 time.sleep(0.01)
                 continue
@@ -31,12 +46,26 @@ class Camera:
             with self.lock:
                 # Flip frame horizontally for natural 'mirror' interaction
                 self.frame = cv2.flip(frame, 1)
+                self.frame_timestamp = captured_at
+                
+            if self.is_playback:
+                time.sleep(1.0 / (self.cap.get(cv2.CAP_PROP_FPS) or 30.0))
                 
     def read(self):
         """Returns the latest captured frame."""
         with self.lock:
             return self.frame
             
+    def read_with_timestamp(self):
+        """Returns the latest frame together with its capture time (time.perf_counter)."""
+        with self.lock:
+            return self.frame, self.frame_timestamp
+            
+    def set_capture(self, width: int, height: int, fps: int):
+        """Requests a new capture resolution and frame rate; the newest request always wins."""
+        with self.lock:
+            self._pending_settings = (width, height, fps)
+        
     def stop(self):
         """Stops the capture thread and releases the camera."""
         self.stopped = True
@@ -0,0 +1,312 @@
+import math
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from vision.gesture_interpreter import GestureInterpreter
+from vision.synthetic_source import synthetic_hand
+
+logger = logging.getLogger("pybite.vision")
+
+MODEL_VERSION = 1
+
+# Class order of the direction head; index 0 is "no direction"
+DIRECTIONS = (None, "UP", "DOWN", "LEFT", "RIGHT")
+UNLABELLED = -1  # Head not labelled for this sample (e.g. direction while pinching)
+
+WRIST, THUMB_TIP, INDEX_MCP, INDEX_TIP, MIDDLE_MCP = 0, 4, 5, 8, 9
+FINGER_TIPS = [8, 12, 16, 20]
+FINGER_MCPS = [5, 9, 13, 17]
+
+# 20 wrist-relative (x, y) points, pinch distance, 4 finger fold ratios, constant 1 for the bias
+NUM_FEATURES = 20 * 2 + 1 + 4 + 1
+NUM_OUTPUTS = len(DIRECTIONS) + 2  # Direction logits, then pinch and fist logits
+
+
+def landmark_features(landmarks) -> np.ndarray:
+    """
+    Turns (21, 2+) landmarks, or a (N, 21, 2+) batch, into features that do not change
+    when the hand moves across the image or nearer to / further from the camera.
+
+    Points are taken relative to the wrist and measured in wrist-to-middle-MCP lengths,
+    which stay put whatever the fingers do. The pinch distance and fold ratios are the
+    quantities the heuristics threshold, given to the model directly since a linear
+    model cannot derive distances from coordinates.
+    """
+    points = np.asarray(landmarks, dtype=np.float32)[..., :2]
+    single = points.ndim == 2
+    if single:
+        points = points[None]
+    n = len(points)
+
+    rel = points - points[:, WRIST:WRIST + 1]
+    size = np.sqrt((rel[:, MIDDLE_MCP] ** 2).sum(axis=1))
+    rel /= np.maximum(size, 1e-6)[:, None, None]
+
+    dist = np.sqrt((rel ** 2).sum(axis=2))  # From the wrist
+    pinch = np.sqrt(((rel[:, THUMB_TIP] - rel[:, INDEX_TIP]) ** 2).sum(axis=1))
+    folds = dist[:, FINGER_TIPS] / np.maximum(dist[:, FINGER_MCPS], 1e-6)
+
+    features = np.concatenate(
+        [rel[:, 1:].reshape(n, -1), pinch[:, None], folds, np.ones((n, 1), dtype=np.float32)], axis=1)
+    return features[0] if single else features
+
+
+@dataclass
+class GestureSamples:
+    """Labelled hands: landmarks plus per-head labels, UNLABELLED where a head does not apply."""
+    landmarks: np.ndarray  # (N, 21, 3) float32
+    direction: np.ndarray  # (N,) int8, index into DIRECTIONS
+    phase: np.ndarray  # (N,) int8, 1 = pinching
+    boost: np.ndarray  # (N,) int8, 1 = fist
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+    def subset(self, index) -> "GestureSamples":
+        return GestureSamples(self.landmarks[index], self.direction[index], self.phase[index], self.boost[index])
+
+    def split(self, test_fraction: float = 0.2, seed: int = 0) -> Tuple["GestureSamples", "GestureSamples"]:
+        order = np.random.default_rng(seed).permutation(len(self))
+        cut = int(len(self) * (1 - test_fraction))
+        return self.subset(order[:cut]), self.subset(order[cut:])
+
+    def save(self, path: str):
+        np.savez_compressed(path, landmarks=self.landmarks, direction=self.direction,
+                            phase=self.phase, boost=self.boost)
+
+    @classmethod
+    def load(cls, *paths: str) -> "GestureSamples":
+        """Loads and concatenates one or more recordings."""
+        parts = [np.load(path) for path in paths]
+        return cls(*(np.concatenate([p[key] for p in parts])
+                     for key in ("landmarks", "direction", "phase", "boost")))
+
+
+class GestureModel:
+    """
+    Linear gesture classifier. One product of the feature row with a
+    (NUM_FEATURES, NUM_OUTPUTS) matrix gives every head's logits; feature
+    standardisation is folded into the weights at training time.
+    """
+
+    def __init__(self, weights: np.ndarray):
+        if weights.shape != (NUM_FEATURES, NUM_OUTPUTS):
+            raise ValueError(f"Expected weights of shape {(NUM_FEATURES, NUM_OUTPUTS)}, got {weights.shape}")
+        self.weights = np.ascontiguousarray(weights, dtype=np.float32)
+
+    def logits(self, features: np.ndarray) -> np.ndarray:
+        return features @ self.weights
+
+    def classify(self, landmarks: List[tuple]) -> Tuple[Optional[str], bool, bool]:
+        """Direction, pinch and fist for one hand."""
+        z = landmark_features(landmarks) @ self.weights
+        return DIRECTIONS[int(z[:len(DIRECTIONS)].argmax())], bool(z[-2] > 0), bool(z[-1] > 0)
+
+    def predict(self, samples: GestureSamples) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Batch classification: direction indices, pinch and fist flags."""
+        z = self.logits(landmark_features(samples.landmarks))
+        return z[:, :len(DIRECTIONS)].argmax(axis=1), z[:, -2] > 0, z[:, -1] > 0
+
+    def save(self, path: str):
+        np.savez(path, version=MODEL_VERSION, weights=self.weights)
+
+    @classmethod
+    def load(cls, path: str) -> "GestureModel":
+        data = np.load(path)
+        if int(data["version"]) != MODEL_VERSION:
+            raise ValueError(f"Unsupported gesture model version: {int(data['version'])}")
+        return cls(data["weights"])
+
+    @classmethod
+    def train(cls, samples: GestureSamples, epochs: int = 1500, learning_rate: float = 0.5,
+              l2: float = 1e-4) -> "GestureModel":
+        """
+        Fits softmax regression for the direction head and logistic regression for the
+        pinch and fist heads, by full-batch gradient descent with momentum.
+        Unlabelled heads are left out of the loss for that sample.
+        """
+        x = landmark_features(samples.landmarks).astype(np.float64)
+        mean = x[:, :-1].mean(axis=0)
+        std = x[:, :-1].std(axis=0) + 1e-6
+        x[:, :-1] = (x[:, :-1] - mean) / std
+
+        k = len(DIRECTIONS)
+        labelled_dir = samples.direction >= 0
+        targets_dir = np.zeros((len(x), k))
+        targets_dir[labelled_dir, samples.direction[labelled_dir]] = 1.0
+        targets_bin = np.stack([samples.phase, samples.boost], axis=1).astype(np.float64)
+        labelled_bin = targets_bin >= 0
+        dir_weight = labelled_dir[:, None] / max(1, labelled_dir.sum())
+        bin_weight = labelled_bin / np.maximum(1, labelled_bin.sum(axis=0))
+
+        weights = np.zeros((NUM_FEATURES, NUM_OUTPUTS))
+        velocity = np.zeros_like(weights)
+        decay = np.ones((NUM_FEATURES, 1))
+        decay[-1] = 0.0  # No weight decay on the bias row
+        for _ in range(epochs):
+            z = x @ weights
+            d = z[:, :k] - z[:, :k].max(axis=1, keepdims=True)
+            p = np.exp(d)
+            p /= p.sum(axis=1, keepdims=True)
+            b = 1.0 / (1.0 + np.exp(-z[:, k:]))
+            residual = np.concatenate([(p - targets_dir) * dir_weight, (b - targets_bin) * bin_weight], axis=1)
+            gradient = x.T @ residual + l2 * decay * weights
+            velocity = 0.9 * velocity - learning_rate * gradient
+            weights += velocity
+
+        # Fold the standardisation in so inference works on raw features
+        folded = np.empty_like(weights)
+        folded[:-1] = weights[:-1] / std[:, None]
+        folded[-1] = weights[-1] - (mean / std) @ weights[:-1]
+        return cls(folded)
+
+
+class LearnedGestureInterpreter(GestureInterpreter):
+    """Drop-in GestureInterpreter that classifies hands with a trained GestureModel."""
+
+    def __init__(self, model: GestureModel, pinch_threshold: float = 0.02):
+        super().__init__(pinch_threshold)
+        self.model = model
+
+    def classify(self, landmarks: List[tuple]) -> Dict[str, Any]:
+        direction, phase, boost = self.model.classify(landmarks)
+        # Same raw offset and pinch distance as the heuristic path, for the HUD and logs
+        dx = landmarks[INDEX_TIP][0] - landmarks[INDEX_MCP][0]
+        dy = landmarks[INDEX_TIP][1] - landmarks[INDEX_MCP][1]
+        pinch = math.sqrt((landmarks[THUMB_TIP][0] - landmarks[INDEX_TIP][0]) ** 2 +
+                          (landmarks[THUMB_TIP][1] - landmarks[INDEX_TIP][1]) ** 2)
+        return {"direction": direction, "phase": phase, "boost": boost, "raw": (dx, dy), "pinch_distance": pinch}
+
+    def classify_batch(self, hands: np.ndarray) -> List[Dict[str, Any]]:
+        # Every hand through the model in one matmul
+        z = self.model.logits(landmark_features(hands))
+        directions = z[:, :len(DIRECTIONS)].argmax(axis=1).tolist()
+        raw = (hands[:, INDEX_TIP, :2] - hands[:, INDEX_MCP, :2]).tolist()
+        pinch = np.sqrt(((hands[:, THUMB_TIP, :2] - hands[:, INDEX_TIP, :2]) ** 2).sum(axis=1)).tolist()
+        return [
+            {"direction": DIRECTIONS[d], "phase": bool(phase), "boost": bool(boost), "raw": (dx, dy),
+             "pinch_distance": distance}
+            for d, phase, boost, (dx, dy), distance in zip(directions, z[:, -2] > 0, z[:, -1] > 0, raw, pinch)
+        ]
+
+
+def synthetic_samples(count: int, seed: int = 0) -> GestureSamples:
+    """
+    Labelled synthetic hands with random size, position, tilt and tracker jitter.
+    Stands in for recordings in tests and benchmarks.
+    """
+    rng = np.random.default_rng(seed)
+    landmarks = np.empty((count, 21, 3), dtype=np.float32)
+    direction = rng.integers(0, len(DIRECTIONS), count).astype(np.int8)
+    fist = rng.random(count) < 0.2
+    pinch = ~fist & (rng.random(count) < 0.25)
+    direction[fist] = 0  # The index finger is folded away in a fist
+    scale = rng.uniform(0.4, 1.6, count)
+
+    for i in range(count):
+        hand = np.array(synthetic_hand(DIRECTIONS[direction[i]], *rng.uniform(0.25, 0.75, 2),
+                                       scale=scale[i], pinch=bool(pinch[i]), fist=bool(fist[i])))
+        if direction[i] and not pinch[i]:
+            # Point anywhere within 30 degrees of the axis, with varying reach
+            tilt = hand[INDEX_TIP, :2] - hand[INDEX_MCP, :2]
+            angle = rng.uniform(-math.pi / 6, math.pi / 6)
+            c, s = math.cos(angle), math.sin(angle)
+            tilt = np.array([c * tilt[0] - s * tilt[1], s * tilt[0] + c * tilt[1]]) * rng.uniform(0.7, 1.5)
+            hand[INDEX_TIP, :2] = hand[INDEX_MCP, :2] + tilt
+        hand[:, :2] += rng.normal(0.0, 0.004 * scale[i], (21, 2))
+        landmarks[i] = hand
+
+    return GestureSamples(landmarks, direction, pinch.astype(np.int8), fist.astype(np.int8))
+
+
+# Prompts for recording labelled samples: (text shown, direction, phase, boost)
+RECORDING_PROMPTS = [
+    ("Point UP", 1, 0, 0),
+    ("Point DOWN", 2, 0, 0),
+    ("Point LEFT", 3, 0, 0),
+    ("Point RIGHT", 4, 0, 0),
+    ("Curl index finger (no direction)", 0, 0, 0),
+    ("Pinch thumb and index", UNLABELLED, 1, 0),
+    ("Make a fist", 0, 0, 1),
+]
+
+
+def record_samples(camera_source=0, seconds: float = 6.0, settle: float = 1.5,
+                   prompts: Sequence[tuple] = RECORDING_PROMPTS) -> GestureSamples:
+    """
+    Prompts for each gesture in turn and labels every tracked hand with it.
+    The first `settle` seconds of each prompt are skipped while the hand changes pose.
+    """
+    import cv2
+    from vision.camera import Camera
+    from vision.hand_tracker import HandTracker
+
+    camera = Camera(camera_source).start()
+    tracker = HandTracker()
+    rows: List[tuple] = []
+    try:
+        for text, direction, phase, boost in prompts:
+            start = time.perf_counter()
+            while (elapsed := time.perf_counter() - start) < seconds:
+                frame = camera.read()
+                if frame is None:
+                    continue
+                tracker.find_hands(frame)
+                landmarks = tracker.get_landmarks()
+                if landmarks and elapsed >= settle:
+                    rows.append((landmarks, direction, phase, boost))
+                tracker.draw_landmarks(frame)
+                color = (0, 255, 0) if elapsed >= settle else (0, 200, 255)
+                cv2.putText(frame, f"{text} ({seconds - elapsed:.0f}s)", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+                cv2.imshow("PyBite gesture recording", frame)
+                if cv2.waitKey(1) & 0xFF == 27:
+                    raise KeyboardInterrupt
+            logger.info("Recorded '%s': %d samples so far", text, len(rows))
+    finally:
+        camera.stop()
+        cv2.destroyAllWindows()
+
+    return GestureSamples(
+        np.array([r[0] for r in rows], dtype=np.float32).reshape(-1, 21, 3),
+        *(np.array([r[i] for r in rows], dtype=np.int8) for i in (1, 2, 3)),
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Record labelled gestures and train the gesture classifier")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rec = commands.add_parser("record", help="Record prompted, labelled gestures from a camera")
+    rec.add_argument("output", help="Samples file (.npz)")
+    rec.add_argument("--camera", default="0")
+    rec.add_argument("--seconds", type=float, default=6.0, help="Seconds per prompt")
+    train = commands.add_parser("train", help="Train a model from recorded samples")
+    train.add_argument("samples", nargs="*", help="Samples files; synthetic hands if none are given")
+    train.add_argument("--out", required=True, help="Model file (.npz)")
+    train.add_argument("--epochs", type=int, default=1500)
+    args = parser.parse_args()
+
+    from core.telemetry import LOG_FORMAT
+
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    if args.command == "record":
+        source = int(args.camera) if args.camera.isdigit() else args.camera
+        recorded = record_samples(source, seconds=args.seconds)
+        recorded.save(args.output)
+        print(f"Saved {len(recorded)} samples -> {args.output}")
+    else:
+        data = GestureSamples.load(*args.samples) if args.samples else synthetic_samples(20000)
+        train_set, test_set = data.split()
+        model = GestureModel.train(train_set, epochs=args.epochs)
+        model.save(args.out)
+        direction, phase, boost = model.predict(test_set)
+        for name, predicted, truth in (("direction", direction, test_set.direction),
+                                       ("pinch", phase, test_set.phase), ("fist", boost, test_set.boost)):
+            labelled = truth >= 0
+            print(f"{name:<10} held-out accuracy {np.mean(predicted[labelled] == truth[labelled]):.3f}")
+        print(f"Saved model -> {args.out}")
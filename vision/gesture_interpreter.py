@@ -2,24 +2,55 @@ import math
 import logging
 from typing import List, Dict, Any, Optional
 
-# Set up logger
+import numpy as np
+
+from core.telemetry import telemetry
+
+# Set up logger (handlers are configured by the app, see core/telemetry.setup_logging)
 logger = logging.getLogger("pybite.vision")
-logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+
+# Pure sensitivity: One axis must be larger than a small deadzone
+# Use a stable threshold (0.03) to filter noise without requiring large moves
+DEADZONE = 0.03
+
+# Fist: all 4 main fingers (Index, Middle, Ring, Pinky) folded, tip no further from the wrist than its MCP
+FIST_TIPS = [8, 12, 16, 20]
+FIST_MCPS = [5, 9, 13, 17]
 
 class GestureInterpreter:
     """Interprets hand landmarks into game-specific commands."""
     
     def __init__(self, pinch_threshold: float = 0.02):
         self.pinch_threshold = pinch_threshold
-        self._last_direction = None
+        self._last_directions: Dict[int, Optional[str]] = {}
+        self._pinching: Dict[int, bool] = {}
+        self._fist: Dict[int, bool] = {}
+        
+    def get_commands(self, landmark_sets: List[List[tuple]]) -> List[Dict[str, Any]]:
+        """
+        Interprets one landmark list per player, as produced by a single tracking pass.
+        Every hand present is classified together in one batched pass (classify_batch).
+        """
+        present = [i for i, landmarks in enumerate(landmark_sets) if landmarks]
+        classified: List[Optional[Dict[str, Any]]] = [None] * len(landmark_sets)
+        if present:
+            hands = np.asarray([landmark_sets[i] for i in present], dtype=np.float64)
+            for i, command in zip(present, self.classify_batch(hands)):
+                classified[i] = command
+        return [self._track(command, player) for player, command in enumerate(classified)]
         
-    def get_command(self, landmarks: List[tuple]) -> Dict[str, Any]:
+    def get_command(self, landmarks: List[tuple], player: int = 0) -> Dict[str, Any]:
         """
         Analyzes landmarks and returns a command dictionary.
         Landmark indices:
         0: Wrist, 5: Index MCP, 8: Index Tip, 4: Thumb Tip
         """
-        if not landmarks:
+        return self._track(self.classify(landmarks) if landmarks else None, player)
+
+    def _track(self, command: Optional[Dict[str, Any]], player: int) -> Dict[str, Any]:
+        """Per-player bookkeeping for a classified hand (None: no hand): onset logs and telemetry."""
+        if command is None:
+            self._pinching[player] = self._fist[player] = False
             return {
                 "direction": None,
                 "phase": False,
@@ -27,6 +58,36 @@ class GestureInterpreter:
                 "raw": (0.0, 0.0)
             }
             
+        dx, dy = command["raw"]
+                
+        # Log direction changes (lazy formatting: done on the logging thread, if at all)
+        if command["direction"] and command["direction"] != self._last_directions.get(player):
+             logger.info("P%d DIRECTION: %s (dx=%.2e, dy=%.2e)", player + 1, command["direction"], dx, dy)
+             telemetry.count("direction_changes")
+             self._last_directions[player] = command["direction"]
+        
+        # Only the start of a pinch is an event; holding it is not
+        if command["phase"] and not self._pinching.get(player):
+            logger.info("P%d PINCH: distance %.4f", player + 1, command["pinch_distance"])
+            telemetry.count("pinches")
+        self._pinching[player] = command["phase"]
+        
+        if command["boost"] and not self._fist.get(player):
+            telemetry.count("fists")
+        self._fist[player] = command["boost"]
+        
+        return command
+
+    @staticmethod
+    def _direction(dx: float, dy: float) -> Optional[str]:
+        if abs(dx) > DEADZONE or abs(dy) > DEADZONE:
+            if abs(dx) > abs(dy):
+                return "LEFT" if dx < 0 else "RIGHT"
+            return "UP" if dy < 0 else "DOWN"
+        return None
+
+    def classify(self, landmarks: List[tuple]) -> Dict[str, Any]:
+        """Rule-based gesture classification for one hand; no per-player bookkeeping."""
         # Use Index MCP (base of index finger) as local origin for direction
         index_mcp = landmarks[5]
         index_tip = landmarks[8]
@@ -37,47 +98,29 @@ class GestureInterpreter:
         dy = index_tip[1] - index_mcp[1]
 
         command = {
-            "direction": None,
+            "direction": self._direction(dx, dy),
             "phase": False,
             "boost": False,
             "raw": (dx, dy)
         }
-        
-        # Pure sensitivity: One axis must be larger than a small deadzone
-        # Use a stable threshold (0.03) to filter noise without requiring large moves
-        DEADZONE = 0.03
-        
-        if abs(dx) > DEADZONE or abs(dy) > DEADZONE:
-            if abs(dx) > abs(dy):
-                command["direction"] = "LEFT" if dx < 0 else "RIGHT"
-            else:
-                command["direction"] = "UP" if dy < 0 else "DOWN"
-                
-        # Log direction changes
-        if command["direction"] and command["direction"] != self._last_direction:
-             logger.info(f"DIRECTION: {command['direction']} (dx={dx:.2e}, dy={dy:.2e})")
-             self._last_direction = command["direction"]
                 
         # 2. Pinch Detection (Thumb Tip to Index Tip)
         dist = math.sqrt(
             (thumb_tip[0] - index_tip[0])**2 + 
             (thumb_tip[1] - index_tip[1])**2
         )
+        command["pinch_distance"] = dist
         
         if dist < self.pinch_threshold:
             command["phase"] = True
-            logger.info(f"PHASE ACTIVATED: pinch distance {dist:.4f}")
             
         # 3. Fist Detection (Speed Boost/Restart)
         # Require all 4 main fingers (Index, Middle, Ring, Pinky) to be folded
         # This prevents accidental boosts while steering with the index.
-        weighted_tips = [8, 12, 16, 20]
-        weighted_mcp = [5, 9, 13, 17]
-        
         fingers_folded = True
         wrist = landmarks[0]
         
-        for tip_idx, mcp_idx in zip(weighted_tips, weighted_mcp):
+        for tip_idx, mcp_idx in zip(FIST_TIPS, FIST_MCPS):
             tip = landmarks[tip_idx]
             mcp = landmarks[mcp_idx]
             
@@ -91,5 +134,22 @@ class GestureInterpreter:
                 break
                 
         command["boost"] = fingers_folded
-        
         return command
+
+    def classify_batch(self, hands: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        classify() for an (N, 21, 2+) array of hands at once: the distances for every
+        hand are computed in one NumPy pass, with the same rules and thresholds.
+        """
+        # One gather: wrist, thumb tip, the four finger tips, then their MCPs
+        points = hands[:, [0, 4] + FIST_TIPS + FIST_MCPS, :2]
+        raw = points[:, 2] - points[:, 6]  # Index tip - index MCP
+        pinch = np.sqrt(((points[:, 1] - points[:, 2]) ** 2).sum(axis=1))
+        from_wrist = np.sqrt(((points[:, 2:] - points[:, :1]) ** 2).sum(axis=2))
+        fist = (from_wrist[:, :4] <= from_wrist[:, 4:] * 1.1).all(axis=1)
+
+        return [
+            {"direction": self._direction(dx, dy), "phase": bool(p < self.pinch_threshold), "boost": bool(f),
+             "raw": (dx, dy), "pinch_distance": p}
+            for (dx, dy), p, f in zip(raw.tolist(), pinch.tolist(), fist.tolist())
+        ]
@@ -0,0 +1,66 @@
+import math
+from itertools import permutations
+from typing import List, Optional, Tuple
+
+# Palm centre (middle finger MCP) is steadier than the fingertips used for steering
+ANCHOR_LANDMARK = 9
+
+
+class HandAssigner:
+    """
+    Keeps each detected hand bound to the same player across frames.
+
+    MediaPipe returns hands in no particular order, so we match them to the
+    players' last known palm positions, with a penalty when the reported
+    handedness changes. Unclaimed players start from a home position: player
+    1 on the left of the (mirrored) frame, player 2 on the right.
+    """
+
+    def __init__(self, num_players: int = 2, handedness_penalty: float = 0.25, lost_after: int = 15):
+        self.num_players = num_players
+        self.handedness_penalty = handedness_penalty
+        self.lost_after = lost_after  # Frames before a missing player's slot is forgotten
+        self._positions: List[Optional[Tuple[float, float]]] = [None] * num_players
+        self._handedness: List[Optional[str]] = [None] * num_players
+        self._missing = [0] * num_players
+
+    def _home(self, player: int) -> Tuple[float, float]:
+        return ((player + 0.5) / self.num_players, 0.5)
+
+    def _cost(self, player: int, label: str, anchor: Tuple[float, float]) -> float:
+        known = self._positions[player]
+        ref = known if known is not None else self._home(player)
+        cost = math.hypot(anchor[0] - ref[0], anchor[1] - ref[1])
+        if self._handedness[player] and label and label != self._handedness[player]:
+            cost += self.handedness_penalty
+        return cost
+
+    def assign(self, hands: List[Tuple[str, List[tuple]]]) -> List[List[tuple]]:
+        """
+        Maps (handedness, landmarks) pairs from HandTracker.get_hands to player slots.
+        Returns one landmark list per player; empty when that player's hand is not visible.
+        """
+        hands = hands[:self.num_players]
+        anchors = [(lms[ANCHOR_LANDMARK][0], lms[ANCHOR_LANDMARK][1]) for _, lms in hands]
+
+        # Two players means at most two permutations; brute force is the cheapest option
+        best, best_cost = (), math.inf
+        for slots in permutations(range(self.num_players), len(hands)):
+            cost = sum(self._cost(p, hands[h][0], anchors[h]) for h, p in enumerate(slots))
+            if cost < best_cost:
+                best, best_cost = slots, cost
+
+        assigned: List[List[tuple]] = [[] for _ in range(self.num_players)]
+        for h, player in enumerate(best):
+            assigned[player] = hands[h][1]
+            self._positions[player] = anchors[h]
+            self._handedness[player] = hands[h][0] or self._handedness[player]
+            self._missing[player] = 0
+
+        for player in range(self.num_players):
+            if not assigned[player]:
+                self._missing[player] += 1
+                if self._missing[player] > self.lost_after:
+                    self._positions[player] = None
+                    self._handedness[player] = None
+        return assigned
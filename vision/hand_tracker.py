@@ -1,27 +1,47 @@
 import mediapipe as mp
 import cv2
 import numpy as np
-from typing import List, Optional, NamedTuple
+from typing import List, Optional, NamedTuple, Tuple
 
 class HandTracker:
     """Wraps MediaPipe Hands for landmark detection."""
     
-    def __init__(self, static_image_mode=False, max_num_hands=1, min_detection_confidence=0.7):
+    def __init__(self, static_image_mode=False, max_num_hands=1, min_detection_confidence=0.7, model_complexity=1):
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=static_image_mode,
-            max_num_hands=max_num_hands,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=0.5
-        )
+        self.static_image_mode = static_image_mode
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.model_complexity = model_complexity
+        self.hands = self._create_hands()
         self.mp_draw = mp.solutions.drawing_utils
         self.results = None
+        # Fraction of the frame size fed to MediaPipe; landmarks are normalized so callers don't notice
+        self.inference_scale = 1.0
+        
+    def _create_hands(self):
+        return self.mp_hands.Hands(
+            static_image_mode=self.static_image_mode,
+            max_num_hands=self.max_num_hands,
+            model_complexity=self.model_complexity,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=0.5
+        )
+        
+    def set_model_complexity(self, model_complexity: int):
+        """Switches between the full (1) and lite (0) hand models."""
+        if model_complexity != self.model_complexity:
+            self.hands.close()
+            self.model_complexity = model_complexity
+            self.hands = self._create_hands()
         
     def find_hands(self, frame: np.ndarray) -> Optional[NamedTuple]:
         """Processes a frame and returns hand landmarks."""
         if frame is None:
             return None
             
+        if self.inference_scale < 1.0:
+            frame = cv2.resize(frame, None, fx=self.inference_scale, fy=self.inference_scale,
+                               interpolation=cv2.INTER_AREA)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         self.results = self.hands.process(rgb_frame)
         return self.results
@@ -42,3 +62,13 @@ class HandTracker:
                 for lm in hand.landmark:
                     landmarks.append((lm.x, lm.y, lm.z))
         return landmarks
+
+    def get_hands(self) -> List[Tuple[str, List[tuple]]]:
+        """Returns (handedness label, landmarks) for every hand found in the last pass."""
+        hands = []
+        if self.results and self.results.multi_hand_landmarks:
+            handedness = self.results.multi_handedness or []
+            for i, hand in enumerate(self.results.multi_hand_landmarks):
+                label = handedness[i].classification[0].label if i < len(handedness) else ""
+                hands.append((label, [(lm.x, lm.y, lm.z) for lm in hand.landmark]))
+        return hands
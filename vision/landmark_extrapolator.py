@@ -0,0 +1,44 @@
+from typing import Dict, List, Tuple
+
+class LandmarkExtrapolator:
+    """
+    Fills in landmarks on frames where tracking is skipped.
+
+    Keeps the last two tracked landmark sets per player and projects them
+    forward linearly. Projection is capped at max_horizon seconds so a stale
+    hand doesn't drift away.
+    """
+
+    def __init__(self, max_horizon: float = 0.15):
+        self.max_horizon = max_horizon
+        self._history: Dict[int, List[Tuple[float, List[tuple]]]] = {}
+
+    def update(self, player: int, landmarks: List[tuple], timestamp: float):
+        """Records freshly tracked landmarks (an empty list means the hand was lost)."""
+        if not landmarks:
+            self._history.pop(player, None)
+            return
+        history = self._history.setdefault(player, [])
+        history.append((timestamp, landmarks))
+        del history[:-2]
+
+    def predict(self, player: int, timestamp: float) -> List[tuple]:
+        history = self._history.get(player)
+        if not history:
+            return []
+        t1, latest = history[-1]
+        if len(history) < 2:
+            return latest
+        t0, previous = history[0]
+        span = t1 - t0
+        if span <= 0:
+            return latest
+
+        ahead = min(timestamp - t1, self.max_horizon)
+        if ahead <= 0:
+            return latest
+        k = ahead / span
+        return [
+            tuple(c1 + (c1 - c0) * k for c0, c1 in zip(p0, p1))
+            for p0, p1 in zip(previous, latest)
+        ]
@@ -0,0 +1,51 @@
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+# Index fingertip offset from its MCP for each steering gesture (image coordinates, y down)
+_TILTS = {
+    "UP": (0.0, -0.08),
+    "DOWN": (0.0, 0.08),
+    "LEFT": (-0.08, 0.0),
+    "RIGHT": (0.08, 0.0),
+}
+
+def synthetic_hand(direction: Optional[str], x: float = 0.5, y: float = 0.5, scale: float = 1.0,
+                   pinch: bool = False, fist: bool = False) -> List[tuple]:
+    """
+    Builds 21 open-hand landmarks whose index finger points in the given direction
+    (None: curled, no direction). scale stands in for hand size / distance to the camera.
+    """
+    landmarks = [(x, y + 0.15 * scale, 0.0)] * 21  # Wrist and unused joints
+    for tip, mcp in ((8, 5), (12, 9), (16, 13), (20, 17)):
+        landmarks[mcp] = (x, y, 0.0)
+        # Extended fingers, or folded back towards the wrist for a fist
+        landmarks[tip] = (x, y + 0.10 * scale, 0.0) if fist else (x, y - 0.15 * scale, 0.0)
+    if not fist:
+        dx, dy = _TILTS[direction] if direction else (0.0, -0.01)
+        landmarks[8] = (x + dx * scale, y + dy * scale, 0.0)
+    if pinch:
+        landmarks[4] = (landmarks[8][0] + 0.005 * scale, landmarks[8][1], 0.0)
+    else:
+        landmarks[4] = (x - 0.15 * scale, y, 0.0)  # Thumb well away from the index tip: no pinch
+    return landmarks
+
+
+class SyntheticHandSource:
+    """
+    Scripted stand-in for Camera + HandTracker with known gesture onsets.
+    Used to benchmark input latency without a camera or MediaPipe.
+    """
+
+    def __init__(self, script: List[Tuple[float, str]], initial: str = "UP"):
+        # script: (onset time in seconds, direction), in any order
+        self.script = sorted(script)
+        self._onsets = [onset for onset, _ in self.script]
+        self.initial = initial
+
+    def sample(self, timestamp: float) -> Tuple[List[tuple], Optional[float]]:
+        """Returns the landmarks visible at timestamp and the onset of that gesture."""
+        i = bisect_right(self._onsets, timestamp)
+        if i == 0:
+            return synthetic_hand(self.initial), None
+        onset, direction = self.script[i - 1]
+        return synthetic_hand(direction), onset
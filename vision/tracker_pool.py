@@ -0,0 +1,247 @@
+import os
+import queue
+import logging
+import traceback
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger("pybite.tracker_pool")
+
+Hands = List[Tuple[str, List[tuple]]]  # As returned by HandTracker.get_hands()
+
+MAX_RESTARTS = 3  # Per worker, before its stations are given up on
+
+
+def default_tracker(max_num_hands: int):
+    """Worker-side tracker factory; MediaPipe is only imported inside the worker processes."""
+    from vision.hand_tracker import HandTracker
+    return HandTracker(max_num_hands=max_num_hands)
+
+
+def _collect(tasks, results, waiting: Dict[int, tuple], block: bool) -> bool:
+    """
+    Moves queued tasks into `waiting`, keeping only the newest per station.
+    Superseded frames are handed back untracked. Returns False once the pool is closing.
+    """
+    try:
+        task = tasks.get() if block else tasks.get_nowait()
+        while True:
+            if task is None:
+                return False
+            older = waiting.get(task[0])
+            if older is not None:
+                station, slot, _, _, captured_at = older[:5]
+                results.put((station, slot, captured_at, None, None))
+            waiting[task[0]] = task
+            task = tasks.get_nowait()
+    except queue.Empty:
+        return True
+
+
+def _worker(tasks, results, stations: List[int], slot_names: List[List[str]], max_num_hands: int,
+            tracker_factory: Callable):
+    """
+    Tracks hands for a fixed set of stations in frames the host has written to shared memory.
+
+    Every station is served by exactly one worker and one tracker, so MediaPipe's
+    video mode sees each camera's frames in order. Stations with frames waiting
+    take turns, so a busy camera cannot hold up the others sharing this worker.
+    A frame that fails to track still gets a result, with no hands and the error.
+    """
+    # Workers share the host's resource tracker, so attaching here does not take ownership
+    slots = {station: [SharedMemory(name=name) for name in slot_names[station]] for station in stations}
+    trackers = {station: tracker_factory(max_num_hands) for station in stations}
+    waiting: Dict[int, tuple] = {}
+    turn = 0
+    try:
+        while _collect(tasks, results, waiting, block=not waiting):
+            # Round robin, starting with the station after the one served last
+            for offset in range(len(stations)):
+                station = stations[(turn + offset) % len(stations)]
+                if station in waiting:
+                    turn = (turn + offset + 1) % len(stations)
+                    break
+            _, slot, height, width, captured_at, model_complexity, inference_scale = waiting.pop(station)
+            tracker = trackers[station]
+            tracker.set_model_complexity(model_complexity)
+            tracker.inference_scale = inference_scale
+
+            frame = np.ndarray((height, width, 3), dtype=np.uint8, buffer=slots[station][slot].buf)
+            try:
+                tracker.find_hands(frame)
+                hands, error = tracker.get_hands(), None
+            except Exception:
+                hands, error = [], traceback.format_exc()
+            del frame  # Release the view before the slot can be reused or closed
+            results.put((station, slot, captured_at, hands, error))
+    finally:
+        for row in slots.values():
+            for shm in row:
+                shm.close()
+
+
+class TrackerPool:
+    """
+    Hand tracking for several camera stations on a fixed pool of worker processes.
+
+    Station i is always tracked by worker i % workers, through that worker's own
+    task queue, so the pool holds one tracker per station however many workers run.
+    Each station owns `max_in_flight` shared-memory frame slots: by default one
+    being tracked and one waiting behind it. While all of a station's slots are
+    busy its newest frame waits in `pending`, replacing (and counting as dropped)
+    any older one; a waiting frame overtaken in the worker is dropped the same way.
+
+    poll() restarts a worker that has died and returns the slots it held; after
+    MAX_RESTARTS the worker's stations are reported as down and their frames dropped.
+    """
+
+    def __init__(self, stations: int, frame_size: Tuple[int, int] = (640, 480), workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None, max_num_hands: int = 1,
+                 tracker_factory: Callable = default_tracker):
+        # Leave a core for the host's own frame loop; a worker per station is the most that can help
+        self.workers = min(stations, workers or max(1, (os.cpu_count() or 2) - 1))
+        self.max_in_flight = max_in_flight or 2
+        self.frame_size = frame_size
+        self.model_complexity = 1
+        self.inference_scale = 1.0
+
+        width, height = frame_size
+        self._slots = [
+            [SharedMemory(create=True, size=width * height * 3) for _ in range(self.max_in_flight)]
+            for _ in range(stations)
+        ]
+        self._free = [list(range(self.max_in_flight)) for _ in range(stations)]
+        self._pending: Dict[int, Tuple[np.ndarray, float]] = {}
+        self.completed = [0] * stations
+        self.dropped = [0] * stations
+        self.errors = [0] * stations
+        self.restarts = [0] * self.workers
+
+        # Spawned, not forked: the host already runs camera threads and SDL
+        self._context = mp.get_context("spawn")
+        self._results = self._context.Queue()
+        self._worker_args = ([[shm.name for shm in row] for row in self._slots], max_num_hands, tracker_factory)
+        self._stations = [list(range(i, stations, self.workers)) for i in range(self.workers)]
+        self._tasks: List[Optional[mp.Queue]] = [None] * self.workers
+        self._processes: List[Optional[mp.Process]] = [None] * self.workers
+        for i in range(self.workers):
+            self._start_worker(i)
+        logger.info("Tracker pool: %d workers for %d stations, %d frames in flight per station",
+                    self.workers, stations, self.max_in_flight)
+
+    def _start_worker(self, index: int):
+        # A fresh queue each time: a worker that died mid-read may have left the old one locked
+        self._tasks[index] = self._context.Queue()
+        self._processes[index] = self._context.Process(
+            target=_worker, name=f"pybite-tracker-{index}", daemon=True,
+            args=(self._tasks[index], self._results, self._stations[index], *self._worker_args))
+        self._processes[index].start()
+
+    def is_down(self, station: int) -> bool:
+        """True once the station's worker has crashed more than MAX_RESTARTS times."""
+        return self._processes[station % self.workers] is None
+
+    def submit(self, station: int, frame: np.ndarray, captured_at: float):
+        """Queues a frame for tracking, or holds it until one of the station's slots frees up."""
+        if self.is_down(station):
+            self.dropped[station] += 1
+            return
+        if self._free[station]:
+            self._dispatch(station, frame, captured_at)
+            return
+        if station in self._pending:
+            self.dropped[station] += 1
+        self._pending[station] = (frame, captured_at)
+
+    def _dispatch(self, station: int, frame: np.ndarray, captured_at: float):
+        width, height = self.frame_size
+        if frame.shape[0] > height or frame.shape[1] > width:
+            scale = min(width / frame.shape[1], height / frame.shape[0])
+            frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        h, w = frame.shape[:2]
+        slot = self._free[station].pop()
+        view = np.ndarray((h, w, 3), dtype=np.uint8, buffer=self._slots[station][slot].buf)
+        view[:] = frame
+        del view
+        self._tasks[station % self.workers].put(
+            (station, slot, h, w, captured_at, self.model_complexity, self.inference_scale))
+
+    def poll(self, timeout: float = 0.0) -> List[Tuple[int, float, Hands]]:
+        """
+        Collects finished frames as (station, capture time, hands) and refills freed slots.
+        Waits up to timeout seconds for the first result; never blocks by default.
+        A frame whose tracking failed is returned with no hands, and the error is logged.
+        """
+        # Checked before draining, so everything a dead worker managed to post is collected first
+        dead = [i for i, process in enumerate(self._processes) if process is not None and not process.is_alive()]
+        finished = []
+        while True:
+            try:
+                if timeout > 0 and not finished and not dead:
+                    result = self._results.get(timeout=timeout)
+                else:
+                    result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            station, slot, captured_at, hands, error = result
+            self._free[station].append(slot)
+            if error is not None:
+                self.errors[station] += 1
+                logger.error("Tracking failed for station %d:\n%s", station, error)
+            if hands is None:
+                # Overtaken by a newer frame before the worker got to it
+                self.dropped[station] += 1
+            else:
+                self.completed[station] += 1
+                finished.append((station, captured_at, hands))
+            if station in self._pending:
+                self._dispatch(station, *self._pending.pop(station))
+        for index in dead:
+            self._restart(index)
+        return finished
+
+    def _restart(self, index: int):
+        process = self._processes[index]
+        process.join()
+        # Frames queued for or held by the dead worker will never come back
+        self._tasks[index].cancel_join_thread()
+        self._tasks[index].close()
+        for station in self._stations[index]:
+            lost = self.max_in_flight - len(self._free[station])
+            self.dropped[station] += lost
+            self._free[station] = list(range(self.max_in_flight))
+
+        self.restarts[index] += 1
+        if self.restarts[index] > MAX_RESTARTS:
+            logger.error("Tracker worker %d died (exit code %s) %d times; giving up on stations %s",
+                         index, process.exitcode, self.restarts[index], self._stations[index])
+            self._processes[index] = self._tasks[index] = None
+            for station in self._stations[index]:
+                if self._pending.pop(station, None) is not None:
+                    self.dropped[station] += 1
+            return
+        logger.error("Tracker worker %d died (exit code %s); restarting it for stations %s",
+                     index, process.exitcode, self._stations[index])
+        self._start_worker(index)
+        for station in self._stations[index]:
+            if station in self._pending:
+                self._dispatch(station, *self._pending.pop(station))
+
+    def close(self):
+        for tasks in self._tasks:
+            if tasks is not None:
+                tasks.put(None)
+        for process in self._processes:
+            if process is None:
+                continue
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        for row in self._slots:
+            for shm in row:
+                shm.close()
+                shm.unlink()